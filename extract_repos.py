@@ -3,80 +3,108 @@
 Extract Git repositories from HTML files in testdata directory.
 Each HTML file contains multiple files separated by --- markers with FILEPATH headers.
 """
+import mmap
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
+# Repository name pattern: optional date prefix, name, optional branch suffix and extension
+_REPO_NAME_RE = re.compile(r'(?:\d{4}-\d{2}-\d{2}_)?(.+?)(?:-(?:main|develop|dev))?(?:\.md\.html)?')
+
+# Section separator and header marker, matched on the raw file bytes
+_SEPARATOR_RE = re.compile(rb'\r?\n---\r?\n')
+_FILEPATH_MARKER = b'# FILEPATH '
+
+# Section header: FILEPATH line plus the following language marker line (e.g. 'java');
+# the match end is where the file content starts
+_FILEPATH_RE = re.compile(r'# FILEPATH (.+)(?:\n.*)?\n?')
+
+# Path cleanup patterns (applied in order to every extracted file path)
+_TEMP_EXTRACTED_RE = re.compile(r'^temp_extracted_[^/]+/')
+_REPO_MAIN_PREFIX_RE = re.compile(r'^[^/]+-main/')
+_MNT_PREFIX_RE = re.compile(r'^/mnt/c/[^/]+/')
+_DRIVE_PREFIX_RE = re.compile(r'^[A-Z]:[/\\]')
+_REPOS_PREFIX_RE = re.compile(r'^.*?/repos2?/[^/]+/[^/]+/')
+
 
 def extract_repo_name(filename):
     """Extract repository name from filename like '2025-08-25_arvendatenkurier-main.md.html'"""
-    # Remove date prefix and extension
-    name = re.sub(r'^\d{4}-\d{2}-\d{2}_', '', filename)
-    name = re.sub(r'\.md\.html$', '', name)
-    # Remove branch suffix like -main, -develop, -dev
-    name = re.sub(r'-(main|develop|dev)$', '', name)
-    return name
+    # Strip date prefix, branch suffix (-main, -develop, -dev) and extension in one match
+    match = _REPO_NAME_RE.fullmatch(filename)
+    return match.group(1) if match else filename
 
 
-def parse_html_file(filepath):
-    """Parse HTML file and extract all files with their paths and contents"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+def iter_sections(filepath):
+    """
+    Yield the raw (undecoded) sections of an HTML file separated by --- lines.
 
-    files = []
-    # Split by --- markers
-    sections = content.split('\n---\n')
+    The file is memory-mapped, so sections are sliced straight from the page
+    cache instead of decoding the whole file into one string first.
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            for separator in _SEPARATOR_RE.finditer(mm):
+                yield mm[start:separator.start()]
+                start = separator.end()
+            yield mm[start:]
 
-    for section in sections:
-        if not section.strip():
+
+def parse_html_file(filepath):
+    """Parse HTML file and yield all files with their paths and contents"""
+    for raw_section in iter_sections(filepath):
+        # Sections without a FILEPATH header are skipped without being decoded
+        if _FILEPATH_MARKER not in raw_section:
             continue
 
+        section = raw_section.decode('utf-8')
+        if '\r' in section:
+            section = section.replace('\r\n', '\n').replace('\r', '\n')
+
         # Look for FILEPATH marker
-        filepath_match = re.search(r'# FILEPATH (.+)', section)
+        filepath_match = _FILEPATH_RE.search(section)
         if not filepath_match:
             continue
 
         file_path = filepath_match.group(1).strip()
 
-        # Extract content after the FILEPATH line and language marker
-        lines = section.split('\n')
-        filepath_line_idx = None
-        for i, line in enumerate(lines):
-            if '# FILEPATH' in line:
-                filepath_line_idx = i
-                break
-
-        if filepath_line_idx is None:
-            continue
-
-        # Skip the FILEPATH line and the next line (language marker like 'java')
-        content_start = filepath_line_idx + 2
-        file_content = '\n'.join(lines[content_start:])
+        # Content starts after the FILEPATH line and language marker
+        file_content = section[filepath_match.end():]
 
         # Clean up the path - remove temp_extracted prefix if present
-        file_path = re.sub(r'^temp_extracted_[^/]+/', '', file_path)
+        # (cheap substring checks first, the regex only runs on a hit)
+        if file_path.startswith('temp_extracted_'):
+            file_path = _TEMP_EXTRACTED_RE.sub('', file_path, count=1)
         # Also remove the repo name prefix if it's duplicated
-        file_path = re.sub(r'^[^/]+-main/', '', file_path)
+        if '-main/' in file_path:
+            file_path = _REPO_MAIN_PREFIX_RE.sub('', file_path, count=1)
         # Remove any absolute Windows or Linux paths
-        file_path = re.sub(r'^/mnt/c/[^/]+/', '', file_path)
-        file_path = re.sub(r'^[A-Z]:[/\\]', '', file_path)
-        file_path = re.sub(r'^/', '', file_path)
+        if file_path.startswith('/mnt/c/'):
+            file_path = _MNT_PREFIX_RE.sub('', file_path, count=1)
+        if file_path[1:2] == ':':
+            file_path = _DRIVE_PREFIX_RE.sub('', file_path, count=1)
+        if file_path.startswith('/'):
+            file_path = file_path[1:]
         # Remove common project path prefixes
-        file_path = re.sub(r'^.*?/repos2?/[^/]+/[^/]+/', '', file_path)
+        if '/repos' in file_path:
+            file_path = _REPOS_PREFIX_RE.sub('', file_path, count=1)
 
-        files.append({
+        yield {
             'path': file_path,
             'content': file_content
-        })
-
-    return files
+        }
 
 
 def write_files_to_repo(files, repo_path):
-    """Write extracted files to repository directory"""
+    """Write extracted files to repository directory and return the number of files written"""
     repo_path = Path(repo_path)
     repo_path.mkdir(parents=True, exist_ok=True)
 
+    count = 0
     for file_info in files:
         file_path = repo_path / file_info['path']
 
@@ -88,6 +116,19 @@ def write_files_to_repo(files, repo_path):
             f.write(file_info['content'])
 
         print(f"  Wrote: {file_path}")
+        count += 1
+
+    return count
+
+
+def process_html(html_file, repos_dir):
+    """Extract one HTML file into its repository directory and return (repo_name, file_count)"""
+    repo_name = extract_repo_name(html_file.name)
+    repo_path = repos_dir / repo_name
+
+    # Parse HTML file and write each file to the repo directory as it is parsed
+    file_count = write_files_to_repo(parse_html_file(html_file), repo_path)
+    return repo_name, file_count
 
 
 def main():
@@ -103,22 +144,11 @@ def main():
 
     print(f"Found {len(html_files)} HTML files")
 
-    for html_file in html_files:
-        print(f"\nProcessing: {html_file.name}")
-
-        # Extract repo name
-        repo_name = extract_repo_name(html_file.name)
-        print(f"  Repository name: {repo_name}")
-
-        # Parse HTML file
-        files = parse_html_file(html_file)
-        print(f"  Found {len(files)} files")
-
-        # Write to repo directory
-        repo_path = repos_dir / repo_name
-        write_files_to_repo(files, repo_path)
-
-        print(f"  ✓ Extracted to: {repo_path}")
+    # Files are independent, so extract them in parallel (one task per HTML file)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(partial(process_html, repos_dir=repos_dir), html_files)
+        for html_file, (repo_name, file_count) in zip(html_files, results):
+            print(f"\n✓ {html_file.name}: extracted {file_count} files to {repos_dir / repo_name}")
 
     print(f"\n✓ All repositories extracted to {repos_dir}")
 
@@ -6,12 +6,60 @@ For testing, it copies from testdata directory.
 import logging
 import os
 import shutil
+import subprocess
+import sys
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
+def _fast_copytree(src: Path, dst: Path) -> None:
+    """
+    Copy a directory tree using the platform's native copy tool.
+
+    Uses robocopy on Windows and ``cp -a --reflink=auto`` on Linux, which avoid
+    the per-file Python overhead of shutil.copytree (and use CoW clones where the
+    filesystem supports them). Falls back to shutil.copytree if the native tool
+    is unavailable or fails.
+
+    Args:
+        src: Source directory
+        dst: Target directory (must not exist yet)
+    """
+    try:
+        if sys.platform == "win32":
+            result = subprocess.run(
+                ["robocopy", str(src), str(dst), "/E", "/MT:16", "/NFL", "/NDL", "/NJH", "/NJS"],
+                capture_output=True,
+            )
+            # robocopy exit codes below 8 indicate success
+            if result.returncode < 8:
+                return
+        elif sys.platform.startswith("linux"):
+            result = subprocess.run(
+                ["cp", "-a", "--reflink=auto", f"{src}/.", str(dst)],
+                capture_output=True,
+            )
+            if result.returncode == 0:
+                return
+        else:
+            result = None
+
+        if result is not None:
+            logger.warning(
+                f"Native copy failed (exit code {result.returncode}), falling back to shutil.copytree: "
+                f"{result.stderr.decode(errors='replace').strip()}"
+            )
+    except OSError as e:
+        logger.warning(f"Native copy not available, falling back to shutil.copytree: {e}")
+
+    # Fallback: remove partial result and copy in Python
+    if dst.exists():
+        shutil.rmtree(dst)
+    shutil.copytree(src, dst)
+
+
 class GitCloneService:
     """
     Service for cloning repositories.
@@ -20,6 +68,20 @@ class GitCloneService:
 
     def __init__(self, testdata_root: str = "/home/marc/git/archinspect/testdata/repos"):
         self.testdata_root = Path(testdata_root)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Re-scan testdata_root for available repositories.
+
+        The directory listing is cached per instance so that lookups in
+        clone_repository do not hit the filesystem; long-running services
+        should call this after repositories were added to testdata.
+        """
+        try:
+            self._available = {p.name: p for p in self.testdata_root.iterdir() if p.is_dir()}
+        except FileNotFoundError:
+            self._available = {}
 
     def clone_repository(
         self,
@@ -48,17 +110,13 @@ class GitCloneService:
         # Handle variations like "ArvenDatenKurier" -> "arvendatenkurier"
         normalized_name = self._normalize_repo_name(repo_name)
 
-        # Source: testdata directory
-        source_path = self.testdata_root / normalized_name
+        # Source: testdata directory (try original name if normalized doesn't exist)
+        source_path = self._available.get(normalized_name) or self._available.get(repo_name)
 
-        if not source_path.exists():
-            # Try original name if normalized doesn't exist
-            source_path = self.testdata_root / repo_name
-
-        if not source_path.exists():
+        if source_path is None:
             raise FileNotFoundError(
                 f"Repository '{repo_name}' not found in testdata. "
-                f"Expected at: {source_path} or {self.testdata_root / normalized_name}"
+                f"Expected at: {self.testdata_root / repo_name} or {self.testdata_root / normalized_name}"
             )
 
         # Target: organized by namespace
@@ -80,7 +138,7 @@ class GitCloneService:
 
         # Copy repository (simulates git clone)
         try:
-            shutil.copytree(source_path, target_path)
+            _fast_copytree(source_path, target_path)
             logger.info(
                 f"Successfully cloned repository '{repo_name}'",
                 extra={"target": str(target_path), "size_mb": self._get_dir_size(target_path) / 1024 / 1024}
@@ -94,38 +152,60 @@ class GitCloneService:
     def _normalize_repo_name(self, name: str) -> str:
         """
         Normalize repository name for testdata lookup.
-        Handles different naming conventions.
+        Handles different naming conventions (e.g. "Flowhub Azure IaC" -> "flowhub-azure-iac").
         """
-        # Convert to lowercase
-        normalized = name.lower()
-
-        # Remove common suffixes
-        for suffix in ["-main", "-develop", "-dev", "-master"]:
-            if normalized.endswith(suffix):
-                normalized = normalized[:-len(suffix)]
-                break
-
-        # Handle special cases
-        name_mappings = {
-            "arvendatenkurier": "arvendatenkurier",
-            "flowhub azure iac": "flowhub-azure-iac",
-            "yepwebsvc": "yepwebsvc",
-            "agentcommunicationsvc": "agentcommunicationsvc",
-            "contactmanagementsvc": "contactmanagementsvc",
-        }
-
-        return name_mappings.get(normalized, normalized)
+        normalized = name.lower().replace(" ", "-")
+
+        # Remove common branch suffixes
+        for suffix in ("-main", "-develop", "-dev", "-master"):
+            stripped = normalized.removesuffix(suffix)
+            if len(stripped) != len(normalized):
+                return stripped
+
+        return normalized
+
+    def _iter_file_entries(self, path: Path):
+        """Yield a DirEntry for every regular file below path (symlinks are not followed)."""
+        stack = [str(path)]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+
+    def _walk_stats(self, path: Path) -> tuple[int, int]:
+        """Count files and sum their sizes in a single traversal."""
+        file_count = 0
+        size_bytes = 0
+        for entry in self._iter_file_entries(path):
+            file_count += 1
+            size_bytes += entry.stat(follow_symlinks=False).st_size
+        return file_count, size_bytes
 
     def _get_dir_size(self, path: Path) -> int:
-        """Calculate total size of directory in bytes."""
-        total = 0
+        """
+        Calculate total size of directory in bytes.
+
+        On Linux this delegates to a single ``du -sb`` call (native tree walk,
+        apparent size including directory entries); elsewhere, or if du fails,
+        the files are summed with a scandir walk. Logged clone sizes and
+        get_clone_status both use this value, so they always agree.
+        """
+        if sys.platform.startswith("linux"):
+            try:
+                output = subprocess.run(
+                    ["du", "-sb", "--", str(path)], capture_output=True, check=True, text=True
+                ).stdout
+                return int(output.split()[0])
+            except (OSError, subprocess.CalledProcessError, ValueError, IndexError) as e:
+                logger.debug(f"du failed for {path}, falling back to scandir walk: {e}")
+
         try:
-            for entry in path.rglob("*"):
-                if entry.is_file():
-                    total += entry.stat().st_size
+            return self._walk_stats(path)[1]
         except Exception:
-            pass
-        return total
+            return 0
 
     def is_cloned(self, local_path: str) -> bool:
         """Check if repository is already cloned at the given path."""
@@ -195,7 +275,8 @@ class GitCloneService:
             return {"exists": False}
 
         try:
-            file_count = sum(1 for _ in path.rglob("*") if _.is_file())
+            # File entries need no stat call; the size comes from the same source as the clone log
+            file_count = sum(1 for _ in self._iter_file_entries(path))
             size_bytes = self._get_dir_size(path)
 
             return {
@@ -6,7 +6,8 @@ import csv
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from itertools import islice
+from typing import Iterator, List, Optional
 
 from dateutil import parser as date_parser
 
@@ -15,6 +16,26 @@ from domain.ports import GitPlatformPort
 
 logger = logging.getLogger(__name__)
 
+# Expected TSV columns and the default used when a column is missing
+_COLUMN_DEFAULTS = {
+    'external_id': '',
+    'name': '',
+    'web_url': '',
+    'description': '',
+    'namespace_path': '',
+    'visibility': 'internal',
+    'is_active': '1',
+    'created_at': '',
+    'updated_at': '',
+}
+_REQUIRED_COLUMNS = ('external_id', 'name', 'web_url')
+
+# Values of the is_active column (lowercased) that count as active
+_TRUE_VALUES = frozenset({'1', 'true', 'yes'})
+
+# Delimiters recognized in the header line; TAB is the documented format
+_DELIMITERS = '\t,;'
+
 
 class CSVMockAdapter(GitPlatformPort):
     """
@@ -29,6 +50,10 @@ class CSVMockAdapter(GitPlatformPort):
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
+        # Parsed file content, reused across pages until the file changes
+        self._cache: Optional[List[RepositoryDTO]] = None
+        self._cache_mtime_ns: Optional[int] = None
+
     def list_repositories(self, page_size: int = 100, page_token: Optional[str] = None) -> List[RepositoryDTO]:
         """
         Read repositories from TSV file with pagination support.
@@ -42,38 +67,108 @@ class CSVMockAdapter(GitPlatformPort):
         """
         page = int(page_token) if page_token else 1
         logger.info(f"Reading repositories from {self.csv_path} (page={page}, page_size={page_size})")
-        all_repositories = []
+        all_repositories = self._load_repositories()
+
+        # Apply pagination
+        start_idx = (page - 1) * page_size
+        end_idx = start_idx + page_size
+        paginated_repositories = all_repositories[start_idx:end_idx]
+
+        logger.info(f"Loaded {len(all_repositories)} total repositories, returning {len(paginated_repositories)} for page {page}")
+        return paginated_repositories
+
+    def _load_repositories(self) -> List[RepositoryDTO]:
+        """
+        Return all repositories from the TSV file.
+
+        The parsed result is cached on the instance and only re-read when the
+        file's modification time changes, so paging through the file parses
+        it once instead of once per page.
+        """
+        mtime_ns = self.csv_path.stat().st_mtime_ns
+        if self._cache is None or mtime_ns != self._cache_mtime_ns:
+            self._cache = self._read_repositories()
+            self._cache_mtime_ns = mtime_ns
+        return self._cache
+
+    def iter_repository_pages(self, page_size: int = 100) -> Iterator[List[RepositoryDTO]]:
+        """
+        Yield all repositories of the file page by page.
 
+        Uses the cached parse result if it is current; otherwise the file is
+        read in a single streaming pass instead of once per requested page.
+
+        Args:
+            page_size: Number of repositories per page
+
+        Yields:
+            Non-empty lists of RepositoryDTO objects
+        """
+        if self._cache is not None and self.csv_path.stat().st_mtime_ns == self._cache_mtime_ns:
+            rows = iter(self._cache)
+        else:
+            logger.info(f"Streaming repositories from {self.csv_path} (page_size={page_size})")
+            rows = self._iter_repositories()
+
+        for page in iter(lambda: list(islice(rows, page_size)), []):
+            yield page
+
+    def _read_repositories(self) -> List[RepositoryDTO]:
+        """Parse all rows of the file into RepositoryDTO objects."""
+        return list(self._iter_repositories())
+
+    def _iter_repositories(self) -> Iterator[RepositoryDTO]:
+        """Parse the rows of the file into RepositoryDTO objects one at a time."""
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as f:
-                # TSV file with TAB delimiter
-                reader = csv.DictReader(f, delimiter='\t')
+            with open(self.csv_path, 'r', encoding='utf-8', newline='') as f:
+                # The delimiter is detected once from the header line; column
+                # positions are resolved once instead of building a dict per row
+                reader = csv.reader(f, delimiter=self._detect_delimiter(f.readline()))
+                f.seek(0)
+                header = next(reader, [])
+                missing = [col for col in _REQUIRED_COLUMNS if col not in header]
+                if header and missing:
+                    raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+                positions = [
+                    (header.index(col) if col in header else None, default)
+                    for col, default in _COLUMN_DEFAULTS.items()
+                ]
 
                 for row in reader:
+                    if not row:
+                        continue
                     try:
+                        (
+                            external_id, name, web_url, description, namespace_path,
+                            visibility, is_active_str, created_at_str, updated_at_str,
+                        ) = [
+                            row[pos].strip() if pos is not None and pos < len(row) else default
+                            for pos, default in positions
+                        ]
+
                         # Parse is_active (convert to boolean)
-                        is_active_str = row.get('is_active', '1').strip()
-                        is_active = is_active_str in ('1', 'true', 'True', 'yes')
+                        is_active = is_active_str.lower() in _TRUE_VALUES
 
                         # Parse dates with flexible format
-                        created_at = self._parse_date(row.get('created_at', ''))
-                        updated_at = self._parse_date(row.get('updated_at', ''))
+                        created_at = self._parse_date(created_at_str)
+                        updated_at = self._parse_date(updated_at_str)
 
                         # Create DTO
                         repo = RepositoryDTO(
-                            external_id=row['external_id'].strip(),
-                            name=row['name'].strip(),
-                            url=row['web_url'].strip(),
-                            description=row.get('description', '').strip(),
-                            namespace_path=row.get('namespace_path', '').strip(),
-                            visibility=row.get('visibility', 'internal').strip(),
+                            external_id=external_id,
+                            name=name,
+                            url=web_url,
+                            description=description,
+                            namespace_path=namespace_path,
+                            visibility=visibility,
                             is_active=is_active,
                             created_at=created_at,
                             updated_at=updated_at,
                         )
 
-                        all_repositories.append(repo)
                         logger.debug(f"Parsed repository: {repo.name}")
+                        yield repo
 
                     except Exception as e:
                         logger.error(f"Error parsing row: {row}, error: {e}")
@@ -83,13 +178,13 @@ class CSVMockAdapter(GitPlatformPort):
             logger.error(f"Error reading CSV file: {e}")
             raise
 
-        # Apply pagination
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_repositories = all_repositories[start_idx:end_idx]
-
-        logger.info(f"Loaded {len(all_repositories)} total repositories, returning {len(paginated_repositories)} for page {page}")
-        return paginated_repositories
+    @staticmethod
+    def _detect_delimiter(header_line: str) -> str:
+        """Return the delimiter of the header line, defaulting to TAB."""
+        try:
+            return csv.Sniffer().sniff(header_line, delimiters=_DELIMITERS).delimiter
+        except csv.Error:
+            return '\t'
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """
@@ -102,13 +197,21 @@ class CSVMockAdapter(GitPlatformPort):
         Returns:
             datetime object or None
         """
-        if not date_str or not date_str.strip():
+        if not date_str:
+            return None
+        date_str = date_str.strip()
+        if not date_str:
             return None
 
         try:
-            # Use dateutil parser for flexible parsing
-            dt = date_parser.parse(date_str)
-            return dt
+            # Fast path: ISO-8601 (the documented export format)
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+
+        try:
+            # Fall back to dateutil parser for other formats
+            return date_parser.parse(date_str)
         except Exception as e:
             logger.warning(f"Could not parse date '{date_str}': {e}")
             return None
@@ -0,0 +1,71 @@
+"""
+File system helpers shared by the mirror adapters.
+"""
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    """
+    Hardlink src to dst, falling back to a regular copy.
+
+    Used as copytree copy_function when source and target share a filesystem;
+    mirrored trees are only read during analysis, so sharing inodes is safe.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def replace_tree(source_path: Path, target_path: Path, link_files: bool = False) -> None:
+    """
+    Copy a directory tree to target_path, replacing an existing tree there.
+
+    The copy is staged next to the target and renamed into place, so the target
+    is never half-written. A previous tree is renamed aside and deleted in a
+    background thread instead of blocking the caller.
+
+    Args:
+        source_path: Directory to copy
+        target_path: Destination directory (its parent must exist)
+        link_files: Hardlink files instead of copying their bytes when source
+            and target are on the same filesystem
+    """
+    parent = target_path.parent
+    name = target_path.name
+
+    copy_function = shutil.copy2
+    if link_files and source_path.stat().st_dev == parent.stat().st_dev:
+        copy_function = link_or_copy
+
+    # Unique staging directories keep concurrent mirrors of the same parent apart
+    staging_dir = Path(tempfile.mkdtemp(prefix=f".{name}.new-", dir=parent))
+    try:
+        staged_path = staging_dir / name
+        shutil.copytree(source_path, staged_path, copy_function=copy_function)
+
+        old_dir = None
+        if target_path.exists():
+            old_dir = Path(tempfile.mkdtemp(prefix=f".{name}.old-", dir=parent))
+            os.rename(target_path, old_dir / name)
+
+        try:
+            os.rename(staged_path, target_path)
+        except OSError:
+            # Put the previous tree back rather than leaving no tree at all
+            if old_dir is not None:
+                os.rename(old_dir / name, target_path)
+            raise
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    if old_dir is not None:
+        logger.info(f"Removing previous tree of {target_path} in background")
+        threading.Thread(target=shutil.rmtree, args=(old_dir,), kwargs={"ignore_errors": True}, daemon=True).start()
@@ -3,22 +3,24 @@ GitLab adapter for importing repositories from GitLab instance.
 Implements GitPlatformPort using python-gitlab library.
 """
 import logging
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
 
 import gitlab
+from dateutil import parser as date_parser
 from gitlab.exceptions import GitlabError
 
+from adapters.git_platform.gitlab_session import create_session
+from adapters.git_platform.gitlab_utils import mask_token
 from domain.entities import RepositoryDTO
 from domain.ports import GitPlatformPort
 
 logger = logging.getLogger(__name__)
 
 
-def mask_token(token: str) -> str:
-    """Mask token for logging purposes."""
-    return (token[:4] + "...") if token else "<empty>"
-
-
 class GitLabAdapter(GitPlatformPort):
     """
     Adapter for fetching repositories from GitLab.
@@ -27,9 +29,29 @@ class GitLabAdapter(GitPlatformPort):
         private_token: GitLab private access token
         gitlab_url: GitLab instance URL (e.g., 'https://gitlab.com')
         ssl_verify: Whether to verify SSL certificates (default: True)
+        validate: Whether to authenticate in the constructor (default: False)
+        max_workers: Number of concurrent page requests (default: 8)
     """
 
-    def __init__(self, private_token: str, gitlab_url: str, ssl_verify: bool = True):
+    # Filters applied to every project listing request
+    PROJECT_LIST_FILTERS = {
+        # Get all projects the user has access to
+        "membership": True,
+        # Exclude archived projects
+        "archived": False,
+        # Order by last activity
+        "order_by": "last_activity_at",
+        "sort": "desc",
+    }
+
+    def __init__(
+        self,
+        private_token: str,
+        gitlab_url: str,
+        ssl_verify: bool = True,
+        validate: bool = False,
+        max_workers: int = 8
+    ):
         """
         Initialize GitLab adapter.
 
@@ -37,17 +59,24 @@ class GitLabAdapter(GitPlatformPort):
             private_token: GitLab private access token
             gitlab_url: GitLab instance URL
             ssl_verify: Whether to verify SSL certificates
+            validate: Whether to check the token with an API call right away; otherwise
+                authentication errors surface on the first real API call
+            max_workers: Number of concurrent page requests when listing all repositories
         """
         logger.debug(f"Init GitLab: base='{gitlab_url}', token='{mask_token(private_token)}', ssl_verify={ssl_verify}")
 
-        try:
-            self.gl = gitlab.Gitlab(gitlab_url, private_token=private_token, ssl_verify=ssl_verify)
-            # Test authentication
-            self.gl.auth()
-            logger.info(f"Successfully authenticated with GitLab at {gitlab_url}")
-        except GitlabError as e:
-            logger.error(f"Failed to authenticate with GitLab: {e}")
-            raise
+        self.max_workers = max_workers
+        self.gl = gitlab.Gitlab(
+            gitlab_url, private_token=private_token, ssl_verify=ssl_verify, session=create_session()
+        )
+
+        if validate:
+            try:
+                self.gl.auth()
+                logger.info(f"Successfully authenticated with GitLab at {gitlab_url}")
+            except GitlabError as e:
+                logger.error(f"Failed to authenticate with GitLab: {e}")
+                raise
 
     def list_repositories(self, page_size: int = 100, page_token: Optional[str] = None) -> List[RepositoryDTO]:
         """
@@ -61,39 +90,78 @@ class GitLabAdapter(GitPlatformPort):
             List of RepositoryDTO objects
         """
         logger.info(f"Fetching repositories from GitLab (page_size={page_size}, page={page_token or 1})")
-        repositories = []
 
         try:
             # Determine page number
             page = int(page_token) if page_token else 1
 
             # Fetch projects with pagination
-            projects = self.gl.projects.list(
-                page=page,
-                per_page=page_size,
-                # Get all projects the user has access to
-                membership=True,
-                # Include archived projects
-                archived=False,
-                # Order by last activity
-                order_by='last_activity_at',
-                sort='desc'
-            )
+            projects = self.gl.projects.list(page=page, per_page=page_size, **self.PROJECT_LIST_FILTERS)
 
             logger.info(f"Retrieved {len(projects)} projects from GitLab")
 
             # Convert GitLab projects to RepositoryDTO
-            for project in projects:
-                try:
-                    repo_dto = self._convert_project_to_dto(project)
-                    repositories.append(repo_dto)
-                    logger.debug(f"Converted project: {repo_dto.name}")
+            repositories = self._convert_projects(projects)
 
-                except Exception as e:
-                    logger.error(f"Error converting project {getattr(project, 'id', 'unknown')}: {e}")
-                    continue
+        except GitlabError as e:
+            logger.error(f"GitLab API error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error fetching repositories: {e}")
+            raise
+
+        return repositories
+
+    def iter_repository_pages(self, page_size: int = 100) -> Iterator[List[RepositoryDTO]]:
+        """
+        Yield all accessible repositories page by page, fetching pages concurrently.
+
+        Pages are requested by max_workers threads and yielded in listing order,
+        so the caller can store one page while up to max_workers following ones
+        are in flight.
+
+        Args:
+            page_size: Number of repositories per page (default: 100, GitLab maximum)
+
+        Yields:
+            Non-empty lists of RepositoryDTO objects
+        """
+        logger.info(f"Streaming repositories from GitLab (page_size={page_size}, max_workers={self.max_workers})")
 
-            logger.info(f"Successfully converted {len(repositories)} repositories")
+        for page_projects in self._iter_project_pages(page_size, self.max_workers):
+            repositories = self._convert_projects(page_projects)
+            if repositories:
+                yield repositories
+
+    def _iter_project_pages(self, page_size: int, max_workers: int) -> Iterator[list]:
+        """
+        Yield the GitLab projects of every listing page, in listing order.
+
+        The first page is requested through python-gitlab's lazy iterator, whose
+        response carries the total page count (with page= python-gitlab returns
+        a plain list instead); the remaining pages are then fetched in parallel
+        so the HTTP round trips overlap. Falls back to sequential paging if
+        GitLab does not report a page count (it omits the pagination headers
+        for very large result sets).
+        """
+        try:
+            first_page = self.gl.projects.list(iterator=True, per_page=page_size, **self.PROJECT_LIST_FILTERS)
+            total_pages = first_page.total_pages
+
+            if total_pages is None:
+                logger.info("GitLab did not report a page count, fetching pages sequentially")
+                # The iterator loads the next page whenever the current one is consumed
+                for projects in iter(lambda: list(islice(first_page, page_size)), []):
+                    yield projects
+                return
+
+            logger.info(f"Fetching {total_pages} pages from GitLab")
+            # Consume only the already loaded first page; iterating further
+            # would make the iterator fetch the next pages one by one
+            yield list(islice(first_page, page_size))
+
+            if total_pages > 1:
+                yield from self._fetch_pages(range(2, total_pages + 1), page_size, max_workers)
 
         except GitlabError as e:
             logger.error(f"GitLab API error: {e}")
@@ -102,6 +170,46 @@ class GitLabAdapter(GitPlatformPort):
             logger.error(f"Unexpected error fetching repositories: {e}")
             raise
 
+    def _fetch_pages(self, pages: Iterable[int], page_size: int, max_workers: int) -> Iterator[list]:
+        """
+        Fetch listing pages in a thread pool and yield their projects in page order.
+
+        At most max_workers pages are requested ahead of the page being consumed,
+        so memory stays bounded however slowly the caller processes pages. Pages
+        not yet started are cancelled when the caller stops iterating.
+        """
+        def fetch(page: int) -> list:
+            return self.gl.projects.list(page=page, per_page=page_size, **self.PROJECT_LIST_FILTERS)
+
+        pages = iter(pages)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            pending = deque(executor.submit(fetch, page) for page in islice(pages, max_workers))
+            while pending:
+                projects = pending.popleft().result()
+                # Refill before handing the page out, so requests overlap with the caller
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append(executor.submit(fetch, next_page))
+                yield projects
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _convert_projects(self, projects) -> List[RepositoryDTO]:
+        """Convert GitLab projects to RepositoryDTOs, skipping projects that fail to convert."""
+        repositories = []
+
+        for project in projects:
+            try:
+                repo_dto = self._convert_project_to_dto(project)
+                repositories.append(repo_dto)
+                logger.debug(f"Converted project: {repo_dto.name}")
+
+            except Exception as e:
+                logger.error(f"Error converting project {getattr(project, 'id', 'unknown')}: {e}")
+                continue
+
+        logger.info(f"Successfully converted {len(repositories)} repositories")
         return repositories
 
     def _convert_project_to_dto(self, project) -> RepositoryDTO:
@@ -114,46 +222,54 @@ class GitLabAdapter(GitPlatformPort):
         Returns:
             RepositoryDTO object
         """
+        # Read the raw attribute dict once instead of going through
+        # RESTObject.__getattr__ for every field
+        attrs = project.attributes
+
         # Extract visibility level
-        visibility = getattr(project, 'visibility', 'internal')
+        visibility = attrs.get('visibility', 'internal')
 
         # Determine if project is active (not archived)
-        is_active = not getattr(project, 'archived', False)
+        is_active = not attrs.get('archived', False)
 
         # Extract dates
-        created_at = getattr(project, 'created_at', None)
-        updated_at = getattr(project, 'last_activity_at', None)
+        created_at = attrs.get('created_at')
+        updated_at = attrs.get('last_activity_at')
 
         # Parse dates if they are strings
         if created_at and isinstance(created_at, str):
-            from dateutil import parser as date_parser
             try:
-                created_at = date_parser.parse(created_at)
-            except Exception as e:
-                logger.warning(f"Could not parse created_at '{created_at}': {e}")
-                created_at = None
+                created_at = datetime.fromisoformat(created_at)
+            except ValueError:
+                try:
+                    created_at = date_parser.parse(created_at)
+                except Exception as e:
+                    logger.warning(f"Could not parse created_at '{created_at}': {e}")
+                    created_at = None
 
         if updated_at and isinstance(updated_at, str):
-            from dateutil import parser as date_parser
             try:
-                updated_at = date_parser.parse(updated_at)
-            except Exception as e:
-                logger.warning(f"Could not parse updated_at '{updated_at}': {e}")
-                updated_at = None
+                updated_at = datetime.fromisoformat(updated_at)
+            except ValueError:
+                try:
+                    updated_at = date_parser.parse(updated_at)
+                except Exception as e:
+                    logger.warning(f"Could not parse updated_at '{updated_at}': {e}")
+                    updated_at = None
 
         # Build RepositoryDTO
         repo_dto = RepositoryDTO(
-            external_id=str(project.id),
-            name=project.name,
-            url=project.web_url,
-            description=getattr(project, 'description', '') or '',
-            namespace_path=getattr(project, 'path_with_namespace', ''),
+            external_id=str(attrs['id']),
+            name=attrs['name'],
+            url=attrs['web_url'],
+            description=attrs.get('description') or '',
+            namespace_path=attrs.get('path_with_namespace', ''),
             visibility=visibility,
             is_active=is_active,
             created_at=created_at,
             updated_at=updated_at,
             # Tech stack could be derived from topics/tags if available
-            tech_stack=', '.join(getattr(project, 'topics', []) or getattr(project, 'tag_list', []))
+            tech_stack=', '.join(attrs.get('topics') or attrs.get('tag_list') or [])
         )
 
         return repo_dto
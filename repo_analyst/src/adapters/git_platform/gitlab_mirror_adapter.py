@@ -4,39 +4,48 @@ Uses python-gitlab and GitPython for repository operations.
 """
 import logging
 import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
-import git
 import gitlab
 from git.exc import GitCommandError
 from gitlab.exceptions import GitlabError, GitlabGetError
 
+from adapters.git_platform.gitlab_session import create_session
+from adapters.git_platform.gitlab_utils import (
+    ProjectCache,
+    derive_clone_url,
+    fetch_and_reset,
+    git_clone,
+    is_not_found_error,
+    mask_token,
+    parallel_clone_options,
+    parse_repo_path,
+)
 from domain.ports import RepositoryMirrorPort
 
 logger = logging.getLogger(__name__)
 
-
-def mask_token(token: str) -> str:
-    """Mask token for logging purposes."""
-    return (token[:4] + "...") if token else "<empty>"
-
-
-def parse_repo_path(git_web_url: str) -> str:
+def prepare_target_dirs(paths: Iterable[Path]) -> Set[Path]:
     """
-    Parse repository path from Git web URL.
+    Create the parent directories of several clone targets up front.
+
+    Repositories of one namespace share their parent, so each distinct parent is
+    created only once instead of once per repository.
 
     Args:
-        git_web_url: Full web URL to the repository
+        paths: Clone target directories
 
     Returns:
-        Repository path without .git suffix
+        Set of parent directories that exist afterwards
     """
-    u = urlparse(git_web_url)
-    path = u.path.strip("/")
-    if path.endswith(".git"):
-        path = path[:-4]
-    return path
+    parents = {path.parent for path in paths}
+    for parent in sorted(parents):
+        parent.mkdir(parents=True, exist_ok=True)
+    return parents
 
 
 class GitLabMirrorAdapter(RepositoryMirrorPort):
@@ -48,9 +57,20 @@ class GitLabMirrorAdapter(RepositoryMirrorPort):
         private_token: GitLab private access token
         gitlab_url: GitLab instance URL (e.g., 'https://gitlab.com')
         ssl_verify: Whether to verify SSL certificates (default: True)
+        clone_depth: History depth for clone and pull, None for full history (default: 1)
+        partial: Whether to do a blob-less partial clone (default: True)
+        validate: Whether to authenticate in the constructor (default: False)
     """
 
-    def __init__(self, private_token: str, gitlab_url: str, ssl_verify: bool = True):
+    def __init__(
+        self,
+        private_token: str,
+        gitlab_url: str,
+        ssl_verify: bool = True,
+        clone_depth: Optional[int] = 1,
+        partial: bool = True,
+        validate: bool = False
+    ):
         """
         Initialize GitLab mirror adapter.
 
@@ -58,18 +78,34 @@ class GitLabMirrorAdapter(RepositoryMirrorPort):
             private_token: GitLab private access token for authentication
             gitlab_url: GitLab instance base URL
             ssl_verify: Whether to verify SSL certificates
+            clone_depth: Number of commits to fetch, None to fetch the full history
+            partial: Whether to skip downloading blobs until they are needed
+            validate: Whether to check the token with an API call right away; otherwise
+                authentication errors surface on the first real API call
         """
+        self.clone_depth = clone_depth
+        self.partial = partial
+        # resolve_project results, including recently failed lookups
+        self._project_cache = ProjectCache()
+        # First clone per top-level namespace, used as object reference for its siblings
+        self._reference_repos: Dict[str, str] = {}
+        # Parent directories created by mirror_many, no need to mkdir them per clone
+        self._prepared_dirs: Set[Path] = set()
+
         logger.debug(f"Init GitLab Mirror: base='{gitlab_url}', token='{mask_token(private_token)}', ssl_verify={ssl_verify}")
 
-        try:
-            self.gl = gitlab.Gitlab(gitlab_url, private_token=private_token, ssl_verify=ssl_verify)
-            self.access_token = private_token
-            # Test authentication
-            self.gl.auth()
-            logger.info(f"Successfully authenticated GitLab mirror adapter at {gitlab_url}")
-        except GitlabError as e:
-            logger.error(f"Failed to authenticate with GitLab: {e}")
-            raise
+        self.gl = gitlab.Gitlab(
+            gitlab_url, private_token=private_token, ssl_verify=ssl_verify, session=create_session()
+        )
+        self.access_token = private_token
+
+        if validate:
+            try:
+                self.gl.auth()
+                logger.info(f"Successfully authenticated GitLab mirror adapter at {gitlab_url}")
+            except GitlabError as e:
+                logger.error(f"Failed to authenticate with GitLab: {e}")
+                raise
 
     def mirror_repository(self, repo_name: str, repo_url: str, namespace_path: str, target_dir: Path) -> Path:
         """
@@ -94,12 +130,114 @@ class GitLabMirrorAdapter(RepositoryMirrorPort):
             logger.error(f"Failed to mirror repository {repo_name}: {e}")
             raise
 
+    def mirror_many(
+        self,
+        repositories: Iterable,
+        target_dir: Path,
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[object, Union[Path, Exception]]]:
+        """
+        Mirror several repositories concurrently.
+
+        Clone and pull are network/IO-bound and independent per repository, so they
+        run on a thread pool. Repositories sharing the same path are serialized by a
+        per-path lock to avoid concurrent writes to one working copy.
+
+        Args:
+            repositories: Objects with name, url and namespace_path attributes
+            target_dir: Target directory for mirroring
+            max_workers: Number of worker threads (default: 3/4 of the CPUs, at most 8)
+
+        Returns:
+            List of (repository, result) tuples in input order, where result is the
+            mirrored path or the exception raised for that repository
+        """
+        repositories = list(repositories)
+        mirror_one = self._mirror_worker(repositories, target_dir)
+        max_workers = max_workers or self._default_workers()
+
+        logger.info(f"Mirroring repositories with {max_workers} workers")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(mirror_one, repositories))
+
+    def iter_mirror_many(
+        self,
+        repositories: Iterable,
+        target_dir: Path,
+        max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[object, Union[Path, Exception]]]:
+        """
+        Mirror several repositories concurrently, yielding results as they finish.
+
+        Same as mirror_many, but (repository, result) tuples are yielded in
+        completion order, so callers can report progress and persist results
+        while other repositories are still being mirrored.
+
+        Args:
+            repositories: Objects with name, url and namespace_path attributes
+            target_dir: Target directory for mirroring
+            max_workers: Number of worker threads (default: 3/4 of the CPUs, at most 8)
+
+        Yields:
+            (repository, result) tuples, where result is the mirrored path or the
+            exception raised for that repository
+        """
+        repositories = list(repositories)
+        mirror_one = self._mirror_worker(repositories, target_dir)
+        max_workers = max_workers or self._default_workers()
+
+        logger.info(f"Mirroring repositories with {max_workers} workers")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(mirror_one, repo) for repo in repositories]
+            for future in as_completed(futures):
+                yield future.result()
+
+    @staticmethod
+    def _default_workers() -> int:
+        """Default number of mirror threads: 3/4 of the CPUs, at most 8."""
+        return min(8, max(1, (os.cpu_count() or 1) * 3 // 4))
+
+    def _mirror_worker(
+        self,
+        repositories: List,
+        target_dir: Path
+    ) -> Callable[[object], Tuple[object, Union[Path, Exception]]]:
+        """
+        Prepare target directories and build the per-repository mirror function.
+
+        The returned function never raises; errors are returned as the result.
+        Repositories sharing the same path are serialized by a per-path lock.
+        """
+        self._prepared_dirs |= prepare_target_dirs(
+            Path(target_dir) / parse_repo_path(repo.url) for repo in repositories
+        )
+
+        locks = defaultdict(threading.Lock)
+        locks_guard = threading.Lock()
+
+        def mirror_one(repo) -> Tuple[object, Union[Path, Exception]]:
+            with locks_guard:
+                lock = locks[parse_repo_path(repo.url)]
+            with lock:
+                try:
+                    return repo, self.mirror_repository(
+                        repo_name=repo.name,
+                        repo_url=repo.url,
+                        namespace_path=repo.namespace_path,
+                        target_dir=target_dir
+                    )
+                except Exception as e:
+                    return repo, e
+
+        return mirror_one
+
     def resolve_project(self, repo_path: str, git_web_url: str):
         """
         Resolve GitLab project by path or web URL.
 
         First tries to get project by path directly.
         If that fails, searches by name and compares URLs.
+        Results are cached per adapter; failed lookups are cached for NOT_FOUND_TTL seconds.
 
         Args:
             repo_path: Repository path (e.g., 'group/project')
@@ -113,27 +251,89 @@ class GitLabMirrorAdapter(RepositoryMirrorPort):
         """
         logger.debug(f"resolve_project: repo_path='{repo_path}', url='{git_web_url}'")
 
+        return self._project_cache.resolve(
+            (repo_path, git_web_url), lambda: self._lookup_project(repo_path, git_web_url)
+        )
+
+    def clear_project_cache(self) -> None:
+        """Forget all resolved and failed project lookups, e.g. after projects were moved or created."""
+        self._project_cache.clear()
+
+    def _lookup_project(self, repo_path: str, git_web_url: str):
+        """Look up a project by path, falling back to a name search (uncached)."""
         try:
             return self.gl.projects.get(repo_path)
 
         except GitlabGetError as e:
             logger.debug(f"projects.get('{repo_path}') failed: {e} (code={getattr(e, 'response_code', 'unknown')})")
 
-            # Fallback: search by name and compare URLs
+            # Fallback: search by name and compare URLs (simple representation
+            # keeps the payload small; it includes all fields used below)
             base = os.path.basename(repo_path)
-            candidates = self.gl.projects.list(search=base, per_page=50)
+            candidates = self.gl.projects.list(search=base, per_page=50, simple=True)
+            wanted_url = git_web_url.removesuffix(".git")
 
             for p in candidates:
-                web = getattr(p, "web_url", "")
-                http = getattr(p, "http_url_to_repo", "").rstrip(".git")
-
-                if web == git_web_url or http == git_web_url.rstrip(".git"):
+                attrs = p.attributes
+                if (attrs.get("web_url") == git_web_url
+                        or attrs.get("http_url_to_repo", "").removesuffix(".git") == wanted_url):
                     logger.debug(f"Found candidate: id={p.id}, ns={getattr(p, 'path_with_namespace', '')}")
                     return p
 
             # If no match found, re-raise original exception
             raise
 
+    def _clone_options(self) -> List[str]:
+        """Build the git clone options for the configured depth and partial clone settings."""
+        options = parallel_clone_options()
+        if self.clone_depth:
+            options += [f"--depth={self.clone_depth}", "--single-branch", "--no-tags"]
+        if self.partial:
+            options.append("--filter=blob:none")
+        return options
+
+    def _clone(self, clone_url: str, target_directory: Path, repo_path: str) -> None:
+        """
+        Clone a repository with the configured clone options.
+
+        For full clones, a repository already cloned from the same top-level
+        namespace is passed as --reference-if-able, so objects shared with it
+        (forks, mirrors) are copied locally instead of downloaded. --dissociate
+        keeps the new clone self-contained. Shallow and partial clones skip this,
+        as they transfer little and git cannot borrow from a shallow reference.
+
+        Args:
+            clone_url: Authenticated clone URL
+            target_directory: Directory to clone into
+            repo_path: Repository path (e.g., 'group/project')
+        """
+        namespace = repo_path.split("/", 1)[0]
+        options = self._clone_options()
+
+        reference = self._reference_repos.get(namespace)
+        if reference and self.clone_depth is None and not self.partial:
+            logger.debug(f"Using {reference} as object reference for {repo_path}")
+            options += ["--reference-if-able", reference, "--dissociate"]
+
+        git_clone(clone_url, target_directory, options)
+        self._reference_repos.setdefault(namespace, str(target_directory))
+
+    def _clone_resolved_project(self, repo_path: str, git_web_url: str, base_directory: Path) -> Path:
+        """Clone a repository using the clone URL and namespace path reported by the GitLab API."""
+        project = self.resolve_project(repo_path, git_web_url)
+        repo_http = project.http_url_to_repo
+
+        logger.debug(f"project.id={project.id}, ns={project.path_with_namespace}, http_url_to_repo={repo_http}")
+
+        target_directory = base_directory / project.path_with_namespace
+        target_directory.parent.mkdir(parents=True, exist_ok=True)
+        self._clone(
+            repo_http.replace("https://", f"https://oauth2:{self.access_token}@"),
+            target_directory,
+            project.path_with_namespace
+        )
+        return target_directory
+
     def update_repository(self, git_web_url: str, base_directory: str) -> Path:
         """
         Clone or pull a GitLab repository.
@@ -141,6 +341,10 @@ class GitLabMirrorAdapter(RepositoryMirrorPort):
         If repository exists locally, performs git pull.
         Otherwise, clones the repository.
 
+        The clone URL and target path are derived from the web URL, so no GitLab
+        API call is needed; the project is only resolved via the API if the
+        derived URL does not exist (e.g. after a rename).
+
         Args:
             git_web_url: Repository web URL
             base_directory: Base directory for repositories
@@ -156,45 +360,37 @@ class GitLabMirrorAdapter(RepositoryMirrorPort):
         logger.info(f"Update repository: path='{repo_path}', base='{base_directory}', url='{git_web_url}'")
 
         try:
-            # Resolve project from GitLab
-            project = self.resolve_project(repo_path, git_web_url)
-            repo_http = project.http_url_to_repo
-
-            logger.debug(f"project.id={project.id}, ns={project.path_with_namespace}, http_url_to_repo={repo_http}")
-
-            # Build authenticated URL
-            auth_url = repo_http.replace("https://", f"https://oauth2:{self.access_token}@")
-
             # Determine target directory using namespace path
-            target_directory = os.path.join(base_directory, project.path_with_namespace)
+            base_path = Path(base_directory)
+            target_directory = base_path / repo_path
             logger.debug(f"Target: {target_directory}")
 
-            # Create target directory if it doesn't exist
-            os.makedirs(target_directory, exist_ok=True)
-
             # Check if repository already exists
-            git_dir = os.path.join(target_directory, ".git")
-
-            if os.path.isdir(git_dir):
+            if (target_directory / ".git").is_dir():
                 # Repository exists, perform pull
                 logger.info(f"Repository exists at {target_directory}, performing git pull...")
-                repo = git.Repo(target_directory)
 
-                # Ensure we're on the default branch
                 try:
-                    origin = repo.remotes.origin
-                    origin.pull()
+                    fetch_and_reset(target_directory, depth=self.clone_depth)
                     logger.info("Pull completed successfully")
                 except Exception as e:
                     logger.warning(f"Pull failed, will try to continue: {e}")
 
             else:
-                # Repository doesn't exist, perform clone
+                # Repository doesn't exist, perform clone (git creates the target directory)
+                if target_directory.parent not in self._prepared_dirs:
+                    target_directory.parent.mkdir(parents=True, exist_ok=True)
                 logger.info(f"Cloning repository to {target_directory}...")
-                git.Repo.clone_from(auth_url, target_directory)
+                try:
+                    self._clone(derive_clone_url(git_web_url, self.access_token), target_directory, repo_path)
+                except GitCommandError as e:
+                    if not is_not_found_error(e):
+                        raise
+                    logger.info(f"Derived clone URL for '{repo_path}' not found, resolving project via GitLab API")
+                    target_directory = self._clone_resolved_project(repo_path, git_web_url, base_path)
                 logger.info("Clone completed successfully")
 
-            return Path(target_directory)
+            return target_directory
 
         except GitCommandError as e:
             logger.exception(f"Git error while cloning/pulling '{repo_path}': {e}")
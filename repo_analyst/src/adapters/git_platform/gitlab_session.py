@@ -0,0 +1,35 @@
+"""
+HTTP session factory for python-gitlab clients.
+Provides a pooled, retrying requests session shared by all API calls of a client.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection pool sizing: enough keep-alive connections for parallel listing and mirroring
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Transient responses that are retried with exponential backoff
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session() -> requests.Session:
+    """
+    Create a requests session with a large keep-alive pool and retries.
+
+    Pass it to gitlab.Gitlab(session=...) so consecutive and concurrent API calls
+    reuse TLS connections instead of reconnecting.
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=RETRY_STATUS_CODES),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -3,34 +3,81 @@ GitLab adapter for source code repository operations.
 Uses GitLab API for repository listing and git commands for cloning.
 """
 import logging
+import queue
 import subprocess
+import threading
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 import os
-from urllib.parse import urlparse
-import git, gitlab
+import gitlab
+from dateutil import parser as date_parser
 from git.exc import GitCommandError
 
 from gitlab.exceptions import GitlabError
 
+from adapters.git_platform.gitlab_session import create_session
+from adapters.git_platform.gitlab_utils import (
+    ProjectCache,
+    derive_clone_url,
+    fetch_and_reset,
+    git_clone,
+    is_not_found_error,
+    mask_token,
+    parallel_clone_options,
+    parse_repo_path,
+)
 from domain.entities import RepositoryDTO
 from domain.ports import SourceCodeRepositoryPort
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of the producer's output in _iter_prefetched
+_DONE = object()
 
-def parse_repo_path(git_web_url: str) -> str:
-    u = urlparse(git_web_url)
-    path = u.path.strip("/")
-    if path.endswith(".git"):
-        path = path[:-4]
-    return path
 
+def _iter_prefetched(iterable: Iterable, buffer_size: int) -> Iterator:
+    """
+    Iterate over iterable in a background thread, buffering up to buffer_size items.
 
+    Used to overlap the HTTP request for the next GitLab page with the conversion
+    of the current one. Exceptions raised by the producer are re-raised to the
+    consumer; if the consumer stops early, the producer stops at its next item.
+    """
+    items = queue.Queue(maxsize=buffer_size)
+    stopped = threading.Event()
 
-def mask_token(token: str) -> str:
-    """Mask token for logging purposes."""
-    return (token[:4] + "...") if token else "<empty>"
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except Exception as e:
+            put(e)
+            return
+        put(_DONE)
+
+    producer = threading.Thread(target=produce, name="gitlab-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
 
 
 class GitLabSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
@@ -41,7 +88,7 @@ class GitLabSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
     - Uses git clone/pull for repository operations
     """
 
-    def __init__(self, private_token: str, gitlab_url: str, ssl_verify: bool = True):
+    def __init__(self, private_token: str, gitlab_url: str, ssl_verify: bool = True, validate: bool = False):
         """
         Initialize GitLab adapter.
 
@@ -49,23 +96,28 @@ class GitLabSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
             private_token: GitLab private access token
             gitlab_url: GitLab instance URL
             ssl_verify: Whether to verify SSL certificates
+            validate: Whether to check the token with an API call right away; otherwise
+                authentication errors surface on the first real API call
         """
         logger.debug(
             f"Init GitLab: base='{gitlab_url}', "
             f"token='{mask_token(private_token)}', ssl_verify={ssl_verify}"
         )
 
-        try:
-            self.gl = gitlab.Gitlab(gitlab_url, private_token=private_token, ssl_verify=ssl_verify)
-            # Test authentication
-            self.gl.auth()
-            logger.info(f"Successfully authenticated with GitLab at {gitlab_url}")
-        except GitlabError as e:
-            logger.error(f"Failed to authenticate with GitLab: {e}")
-            raise
+        self.gl = gitlab.Gitlab(
+            gitlab_url, private_token=private_token, ssl_verify=ssl_verify, session=create_session()
+        )
+        if validate:
+            try:
+                self.gl.auth()
+                logger.info(f"Successfully authenticated with GitLab at {gitlab_url}")
+            except GitlabError as e:
+                logger.error(f"Failed to authenticate with GitLab: {e}")
+                raise
         self.access_token = private_token
         self.gitlab_url = gitlab_url
         self.ssl_verify = ssl_verify
+        self._project_cache = ProjectCache()
 
     def list_repositories(self, page_size: int = 100, page_token: Optional[str] = None) -> List[RepositoryDTO]:
         """
@@ -79,7 +131,6 @@ class GitLabSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
             List of RepositoryDTO objects
         """
         logger.info(f"Fetching repositories from GitLab (page_size={page_size}, page={page_token or 1})")
-        repositories = []
 
         try:
             # Determine page number
@@ -101,15 +152,7 @@ class GitLabSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
             logger.info(f"Retrieved {len(projects)} projects from GitLab")
 
             # Convert GitLab projects to RepositoryDTO
-            for project in projects:
-                try:
-                    repo_dto = self._convert_project_to_dto(project)
-                    repositories.append(repo_dto)
-                    logger.debug(f"Converted project: {repo_dto.name}")
-
-                except Exception as e:
-                    logger.error(f"Error converting project {getattr(project, 'id', 'unknown')}: {e}")
-                    continue
+            repositories = list(self._iter_dtos(projects))
 
             logger.info(f"Successfully converted {len(repositories)} repositories")
 
@@ -120,9 +163,56 @@ class GitLabSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
             logger.error(f"Unexpected error fetching repositories: {e}")
             raise
         return repositories
-        
+
+    def iter_repositories(self, page_size: int = 100) -> Iterator[RepositoryDTO]:
+        """
+        Stream all accessible, non-archived repositories from GitLab.
+
+        Uses python-gitlab's lazy iterator with keyset pagination, so DTOs are
+        produced page by page instead of after all pages were fetched, and large
+        instances do not hit the offset pagination limit. The next page is fetched
+        in a background thread while the current one is converted.
+
+        Args:
+            page_size: Number of projects requested per API call (max. 100)
+
+        Yields:
+            RepositoryDTO objects
+        """
+        logger.info(f"Streaming repositories from GitLab (page_size={page_size})")
+        projects = self.gl.projects.list(
+            iterator=True,
+            per_page=page_size,
+            archived=False,
+            pagination='keyset',
+            order_by='id',
+            sort='asc'
+        )
+        yield from self._iter_dtos(_iter_prefetched(projects, buffer_size=2 * page_size))
+
+    def _iter_dtos(self, projects: Iterable) -> Iterator[RepositoryDTO]:
+        """Convert GitLab projects to RepositoryDTOs, skipping projects that fail to convert."""
+        for project in projects:
+            try:
+                repo_dto = self._convert_project_to_dto(project)
+            except Exception as e:
+                logger.error(f"Error converting project {getattr(project, 'id', 'unknown')}: {e}")
+                continue
+            logger.debug(f"Converted project: {repo_dto.name}")
+            yield repo_dto
+
     def resolve_project(self, repo_path: str, git_web_url: str):
+        """Resolve a GitLab project, caching hits and (for a limited time) misses."""
         logger.debug(f"resolve_project: repo_path='{repo_path}', url='{git_web_url}'")
+        return self._project_cache.resolve(
+            (repo_path, git_web_url), lambda: self._lookup_project(repo_path, git_web_url)
+        )
+
+    def clear_project_cache(self) -> None:
+        """Forget all resolved and failed project lookups."""
+        self._project_cache.clear()
+
+    def _lookup_project(self, repo_path: str, git_web_url: str):
         try:
             return self.gl.projects.get(repo_path)
         except gitlab.exceptions.GitlabGetError as e:
@@ -130,11 +220,12 @@ class GitLabSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
             # Fallback: suche über Namen und vergleiche URLs
 
             base = os.path.basename(repo_path)
-            candidates = self.gl.projects.list(search=base, per_page=50)
+            candidates = self.gl.projects.list(search=base, per_page=50, simple=True)
+            wanted_url = git_web_url.removesuffix(".git")
             for p in candidates:
-                web = getattr(p, "web_url", "")
-                http = getattr(p, "http_url_to_repo", "").rstrip(".git")
-                if web == git_web_url or http == git_web_url.rstrip(".git"):
+                attrs = p.attributes
+                if (attrs.get("web_url") == git_web_url
+                        or attrs.get("http_url_to_repo", "").removesuffix(".git") == wanted_url):
                     logger.debug(f"Kandidat gefunden: id={p.id}, ns={getattr(p, 'path_with_namespace', '')}")
                     return p
 
@@ -144,21 +235,28 @@ class GitLabSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
         repo_path = parse_repo_path(repo_url)
         logger.info(f"Update repository: path='{repo_path}', base='{target_dir}', url='{repo_url}'")
         try:
-            project = self.resolve_project(repo_path, repo_url)
-            repo_http = project.http_url_to_repo
-            logger.debug(f"project.id={project.id}, ns={project.path_with_namespace}, http_url_to_repo={repo_http}")
-            auth_url = repo_http.replace("https://", f"https://oauth2:{self.access_token}@")
-            target_directory = os.path.join(target_dir, project.path_with_namespace)
+            # Clone URL and path are derived from the web URL; the API is only asked on a 404
+            target_directory = Path(target_dir) / repo_path
             logger.debug(f"Ziel: {target_directory}")
-            os.makedirs(target_directory, exist_ok=True)
-            if os.path.isdir(os.path.join(target_directory, ".git")):
-                repo = git.Repo(target_directory)
-                logger.info("git pull ...")
-                repo.remotes.origin.pull()
+            if (target_directory / ".git").is_dir():
+                logger.info("git fetch/reset ...")
+                fetch_and_reset(target_directory)
                 logger.info("Pull OK")
             else:
                 logger.info("git clone ...")
-                git.Repo.clone_from(auth_url, target_directory)
+                target_directory.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    git_clone(derive_clone_url(repo_url, self.access_token), target_directory, parallel_clone_options())
+                except GitCommandError as e:
+                    if not is_not_found_error(e):
+                        raise
+                    project = self.resolve_project(repo_path, repo_url)
+                    repo_http = project.http_url_to_repo
+                    logger.debug(f"project.id={project.id}, ns={project.path_with_namespace}, http_url_to_repo={repo_http}")
+                    auth_url = repo_http.replace("https://", f"https://oauth2:{self.access_token}@")
+                    target_directory = Path(target_dir) / project.path_with_namespace
+                    target_directory.parent.mkdir(parents=True, exist_ok=True)
+                    git_clone(auth_url, target_directory, parallel_clone_options())
                 logger.info("Clone OK")
             return target_dir
 
@@ -171,9 +269,8 @@ class GitLabSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
                
 
     def update_repository(self, local_path: Path) -> Path:
-        repo = git.Repo(local_path)
-        logger.info("git pull ...")
-        repo.remotes.origin.pull()
+        logger.info("git fetch/reset ...")
+        fetch_and_reset(Path(local_path))
         logger.info("Pull OK")
         return Path(local_path)
     
@@ -189,46 +286,56 @@ class GitLabSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
         Returns:
             RepositoryDTO object
         """
+        # Read the raw attribute dict once instead of going through
+        # RESTObject.__getattr__ for every field
+        attrs = project.attributes
+
         # Extract visibility level
-        visibility = getattr(project, 'visibility', 'internal')
+        visibility = attrs.get('visibility', 'internal')
 
         # Determine if project is active (not archived)
-        is_active = not getattr(project, 'archived', False)
+        is_active = not attrs.get('archived', False)
 
         # Extract dates
-        created_at = getattr(project, 'created_at', None)
-        updated_at = getattr(project, 'last_activity_at', None)
+        created_at = attrs.get('created_at')
+        updated_at = attrs.get('last_activity_at')
 
         # Parse dates if they are strings
         if created_at and isinstance(created_at, str):
-            from dateutil import parser as date_parser
             try:
-                created_at = date_parser.parse(created_at)
-            except Exception as e:
-                logger.warning(f"Could not parse created_at '{created_at}': {e}")
-                created_at = None
+                created_at = datetime.fromisoformat(created_at)
+            except ValueError:
+                try:
+                    created_at = date_parser.parse(created_at)
+                except Exception as e:
+                    logger.warning(f"Could not parse created_at '{created_at}': {e}")
+                    created_at = None
 
         if updated_at and isinstance(updated_at, str):
-            from dateutil import parser as date_parser
             try:
-                updated_at = date_parser.parse(updated_at)
-            except Exception as e:
-                logger.warning(f"Could not parse updated_at '{updated_at}': {e}")
-                updated_at = None
+                updated_at = datetime.fromisoformat(updated_at)
+            except ValueError:
+                try:
+                    updated_at = date_parser.parse(updated_at)
+                except Exception as e:
+                    logger.warning(f"Could not parse updated_at '{updated_at}': {e}")
+                    updated_at = None
+
+        # Tech stack could be derived from topics/tags if available
+        topics = attrs.get('topics') or attrs.get('tag_list') or []
 
         # Build RepositoryDTO
         repo_dto = RepositoryDTO(
-            external_id=str(project.id),
-            name=project.name,
-            url=project.web_url,
-            description=getattr(project, 'description', '') or '',
-            namespace_path=getattr(project, 'path_with_namespace', ''),
+            external_id=str(attrs['id']),
+            name=attrs['name'],
+            url=attrs['web_url'],
+            description=attrs.get('description') or '',
+            namespace_path=attrs.get('path_with_namespace', ''),
             visibility=visibility,
             is_active=is_active,
             created_at=created_at,
             updated_at=updated_at,
-            # Tech stack could be derived from topics/tags if available
-            tech_stack=', '.join(getattr(project, 'topics', []) or getattr(project, 'tag_list', []))
+            tech_stack=', '.join(topics)
         )
 
         return repo_dto
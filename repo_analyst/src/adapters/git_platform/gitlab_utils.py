@@ -0,0 +1,212 @@
+"""
+Helpers shared by the GitLab adapters.
+"""
+import os
+import re
+import subprocess
+import time
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Optional
+from urllib.parse import urlparse
+
+from git.exc import GitCommandError
+from gitlab.exceptions import GitlabGetError
+
+# Seconds a failed project lookup is remembered before GitLab is asked again
+NOT_FOUND_TTL = 300
+
+# Maximum number of remembered failed project lookups per ProjectCache
+NOT_FOUND_CACHE_SIZE = 4096
+
+# Environment for git subprocesses: never block a worker on a credential prompt,
+# and abort transfers that stay below 1 KB/s for a minute
+GIT_ENV = {
+    "GIT_TERMINAL_PROMPT": "0",
+    "GIT_HTTP_LOW_SPEED_LIMIT": "1000",
+    "GIT_HTTP_LOW_SPEED_TIME": "60",
+}
+
+# Timeout in seconds for a single fetch or reset of an existing working copy
+GIT_TIMEOUT = 300
+
+
+def parallel_git_config() -> Dict[str, str]:
+    """
+    Git settings that let fetch, pack and index work use all CPU cores.
+
+    Also pins the transport: wire protocol v2 (only the needed refs are
+    advertised; requires git >= 2.18) over HTTP/2 where the server supports it,
+    with a large post buffer so big requests are not sent in small chunks.
+
+    Returns:
+        Mapping of git config keys to values
+    """
+    jobs = str(os.cpu_count() or 1)
+    return {
+        "fetch.parallel": jobs,
+        "submodule.fetchJobs": jobs,
+        "pack.threads": "0",
+        "index.threads": "0",
+        "protocol.version": "2",
+        "http.version": "HTTP/2",
+        "http.postBuffer": "524288000",
+        "core.fsmonitor": "false",
+    }
+
+
+def parallel_clone_options() -> List[str]:
+    """
+    Build "-c key=value" options for the parallel git settings.
+
+    git clone stores them in the new repository's config; for other commands
+    they apply to that invocation only.
+    """
+    options = []
+    for key, value in parallel_git_config().items():
+        options += ["-c", f"{key}={value}"]
+    return options
+
+
+def fetch_and_reset(target_directory: Path, depth: Optional[int] = None, timeout: int = GIT_TIMEOUT) -> None:
+    """
+    Update a mirrored working copy to the remote state.
+
+    Runs "git fetch --prune" and "git reset --hard" directly instead of a
+    GitPython pull: a mirror never has local changes to merge. Shallow clones
+    are fetched at the same depth so the history is not deepened.
+
+    Args:
+        target_directory: Path of the working copy
+        depth: History depth of a shallow clone, None for a full clone
+        timeout: Timeout in seconds per git command
+
+    Raises:
+        subprocess.CalledProcessError: If a git command fails
+        subprocess.TimeoutExpired: If a git command takes longer than timeout
+    """
+    git_cmd = ["git", "-C", str(target_directory), *parallel_clone_options()]
+    env = {**os.environ, **GIT_ENV}
+
+    fetch_cmd = [*git_cmd, "fetch", "--prune", "--no-tags", "origin"]
+    if depth:
+        fetch_cmd.insert(-1, f"--depth={depth}")
+    subprocess.run(fetch_cmd, check=True, capture_output=True, env=env, timeout=timeout)
+
+    # The upstream branch of a shallow single-branch fetch is FETCH_HEAD
+    upstream = "FETCH_HEAD" if depth else "@{u}"
+    subprocess.run(
+        [*git_cmd, "reset", "--hard", upstream], check=True, capture_output=True, env=env, timeout=timeout
+    )
+
+
+def git_clone(clone_url: str, target_directory: Path, options: List[str]) -> None:
+    """
+    Clone a repository by running git directly.
+
+    Avoids GitPython's Repo wrapper around the clone; the result is inspected
+    with git commands later anyway.
+
+    Args:
+        clone_url: Clone URL (may contain credentials)
+        target_directory: Directory to clone into
+        options: Additional git clone options
+
+    Raises:
+        GitCommandError: If git clone fails (credentials are removed from the command)
+    """
+    cmd = ["git", "clone", "--quiet", *options, "--", clone_url, str(target_directory)]
+    result = subprocess.run(cmd, capture_output=True, env={**os.environ, **GIT_ENV})
+    if result.returncode != 0:
+        cmd[-2] = re.sub(r"//[^/@]+@", "//", clone_url)
+        raise GitCommandError(cmd, result.returncode, result.stderr.decode(errors="replace"))
+
+
+def derive_clone_url(git_web_url: str, token: str) -> str:
+    """
+    Derive the authenticated HTTPS clone URL from a repository web URL.
+
+    Args:
+        git_web_url: Full web URL to the repository
+        token: GitLab access token
+
+    Returns:
+        Clone URL with oauth2 credentials and .git suffix
+    """
+    clone_url = git_web_url.rstrip("/").removesuffix(".git") + ".git"
+    return clone_url.replace("https://", f"https://oauth2:{token}@", 1)
+
+
+def is_not_found_error(error: GitCommandError) -> bool:
+    """Check whether a failed git command was caused by a missing remote repository."""
+    stderr = str(error.stderr).lower()
+    return any(marker in stderr for marker in ("not found", "404", "does not appear to be a git repository"))
+
+
+def mask_token(token: str) -> str:
+    """Mask token for logging purposes."""
+    return (token[:4] + "...") if token else "<empty>"
+
+
+def parse_repo_path(git_web_url: str) -> str:
+    """
+    Parse repository path from Git web URL.
+
+    Args:
+        git_web_url: Full web URL to the repository
+
+    Returns:
+        Repository path without .git suffix
+    """
+    u = urlparse(git_web_url)
+    path = u.path.strip("/")
+    if path.endswith(".git"):
+        path = path[:-4]
+    return path
+
+
+class ProjectCache:
+    """
+    Cache of GitLab project lookups.
+
+    Found projects are kept for the lifetime of the cache; failed lookups are
+    remembered for NOT_FOUND_TTL seconds, evicting the oldest ones once
+    NOT_FOUND_CACHE_SIZE are held.
+    """
+
+    def __init__(self):
+        self._found = {}
+        self._not_found = {}
+
+    def resolve(self, key: Hashable, lookup: Callable[[], object]):
+        """
+        Return the cached project for key, calling lookup on a cache miss.
+
+        Raises:
+            GitlabGetError: If lookup fails now or failed less than NOT_FOUND_TTL seconds ago
+        """
+        project = self._found.get(key)
+        if project is not None:
+            return project
+
+        not_found = self._not_found.get(key)
+        if not_found is not None:
+            expires_at, error = not_found
+            if time.monotonic() < expires_at:
+                raise error
+            del self._not_found[key]
+
+        try:
+            project = lookup()
+        except GitlabGetError as e:
+            for stale_key in list(self._not_found)[:len(self._not_found) - NOT_FOUND_CACHE_SIZE + 1]:
+                self._not_found.pop(stale_key, None)
+            self._not_found[key] = (time.monotonic() + NOT_FOUND_TTL, e)
+            raise
+
+        self._found[key] = project
+        return project
+
+    def clear(self) -> None:
+        """Forget all resolved and failed lookups."""
+        self._found.clear()
+        self._not_found.clear()
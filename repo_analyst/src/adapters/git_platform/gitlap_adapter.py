@@ -1,8 +1,23 @@
-
+import logging
+import os
 from pathlib import Path
-
+from typing import List, Optional
+
+import gitlab
+from git.exc import GitCommandError
+
+from adapters.git_platform.gitlab_utils import (
+    fetch_and_reset,
+    git_clone,
+    mask_token,
+    parallel_clone_options,
+    parse_repo_path,
+)
+from domain.entities import RepositoryDTO
 from domain.ports import RepositoryMirrorPort,GitPlatformPort  # Passe ggf. deinen Import-Pfad an
 
+logger = logging.getLogger(__name__)
+
 class GitLabRepositoryService(RepositoryMirrorPort,GitPlatformPort):
     def __init__(self, private_token: str, gitlab_url: str):
         logger.debug(f"Init GitLab: base='{gitlab_url}', token='{mask_token(private_token)}'")
@@ -71,13 +86,12 @@ class GitLabRepositoryService(RepositoryMirrorPort,GitPlatformPort):
             os.makedirs(target_directory, exist_ok=True)
             git_dir = target_directory / ".git"
             if git_dir.is_dir():
-                repo = git.Repo(str(target_directory))
-                logger.info("git pull ...")
-                repo.remotes.origin.pull()
+                logger.info("git fetch/reset ...")
+                fetch_and_reset(target_directory)
                 logger.info("Pull OK")
             else:
                 logger.info("git clone ...")
-                git.Repo.clone_from(auth_url, str(target_directory))
+                git_clone(auth_url, target_directory, parallel_clone_options())
                 logger.info("Clone OK")
 
             return target_directory
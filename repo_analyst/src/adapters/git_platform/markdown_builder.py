@@ -3,9 +3,12 @@ Markdown corpus builder for creating prioritized code documentation.
 Generates a single markdown file with repository structure and source code.
 """
 import logging
-from datetime import datetime
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from domain.ports import MarkdownCorpusPort
 
@@ -35,6 +38,33 @@ class MarkdownCorpusBuilder(MarkdownCorpusPort):
         5: {'.html', '.css'},  # Frontend
     }
 
+    # Priority group per file extension (groups 2-5); group 1 is matched by file name
+    PRIORITY_BY_SUFFIX = {
+        suffix: group for group, suffixes in PRIORITY_GROUPS.items() if group > 1 for suffix in suffixes
+    }
+
+    # Frozen lookup sets for the per-entry filter in _collect_files
+    _SUFFIX_SET = frozenset(SOURCE_EXTENSIONS)
+    _P1_NAMES = frozenset(PRIORITY_GROUPS[1])
+
+    # Group for files that match no priority group
+    REMAINING_GROUP = 6
+
+    # Closing fence written after every file section
+    SECTION_TAIL = b"\n```\n\n"
+
+    # Leading bytes inspected to detect binary files, and the share of control
+    # bytes above which a file counts as binary (NUL bytes always do)
+    BINARY_SNIFF_BYTES = 512
+    BINARY_CONTROL_RATIO = 0.3
+
+    # Bytes that are not control characters; deleted when counting control bytes
+    _NON_CONTROL_BYTES = bytes(b for b in range(256) if not (b < 9 or 13 < b < 32))
+
+    # Reader threads and number of files read ahead while the corpus is written
+    PREFETCH_WORKERS = 4
+    PREFETCH_WINDOW = 8
+
     # Directories to exclude
     EXCLUDE_DIRS = {
         '.git', 'node_modules', 'dist', 'build', 'target', 'venv', '.venv',
@@ -65,24 +95,33 @@ class MarkdownCorpusBuilder(MarkdownCorpusPort):
         """
         logger.info(f"Building markdown corpus for {repo_path}")
 
-        # Merge exclude paths
-        exclude_dirs = self.EXCLUDE_DIRS.union(set(exclude_paths))
+        # Absolute, normalized root: collected file paths then start with it
+        # (e.g. Path(".") would otherwise yield files without the "./" prefix)
+        repo_path = Path(os.path.abspath(repo_path))
+
+        # Merge exclude paths into one frozen set of directory names; entries come
+        # from comma-separated settings and may carry surrounding whitespace
+        exclude_dirs = frozenset(self.EXCLUDE_DIRS.union(p.strip() for p in exclude_paths if p.strip()))
 
-        # Collect all eligible files
-        all_files = self._collect_files(repo_path, exclude_dirs)
+        # Collect all eligible files with their sizes
+        file_sizes = dict(self._collect_files(repo_path, exclude_dirs))
+        all_files = list(file_sizes)
         logger.info(f"Found {len(all_files)} eligible files")
 
         # Prioritize files
         prioritized_files = self._prioritize_files(all_files, repo_path)
         logger.info(f"Prioritized {len(prioritized_files)} files")
 
-        # Generate markdown with size limit
-        output_path = self._generate_output_path(repo_path, output_dir)
+        # Generate markdown with size limit; file name and header share one timestamp
+        generated_at = datetime.now(timezone.utc)
+        output_path = self._generate_output_path(repo_path, output_dir, generated_at)
         file_count, total_size, is_complete = self._write_markdown(
             prioritized_files,
             repo_path,
             output_path,
-            max_bytes
+            max_bytes,
+            file_sizes,
+            generated_at
         )
 
         logger.info(
@@ -92,24 +131,38 @@ class MarkdownCorpusBuilder(MarkdownCorpusPort):
 
         return output_path
 
-    def _collect_files(self, repo_path: Path, exclude_dirs: Set[str]) -> List[Path]:
-        """Collect all eligible source files."""
+    def _collect_files(self, repo_path: Path, exclude_dirs: Set[str]) -> List[Tuple[Path, int]]:
+        """Collect all eligible source files with their size in bytes."""
         files = []
+        suffixes = self._SUFFIX_SET
+        p1_names = self._P1_NAMES
 
-        for item in repo_path.rglob('*'):
-            # Skip directories
-            if item.is_dir():
-                continue
+        for entry in self._scandir_recursive(str(repo_path), exclude_dirs):
+            # Check if file extension is in whitelist; like os.path.splitext,
+            # leading dots belong to the name, not the suffix
+            name = entry.name
+            stem, dot, ext = name.rpartition('.')
+            if (dot and stem.strip('.') and '.' + ext.lower() in suffixes) or name in p1_names:
+                files.append((Path(entry.path), entry.stat(follow_symlinks=False).st_size))
 
-            # Skip excluded directories
-            if any(excluded in item.parts for excluded in exclude_dirs):
-                continue
+        return files
 
-            # Check if file extension is in whitelist
-            if item.suffix.lower() in self.SOURCE_EXTENSIONS or item.name in self.PRIORITY_GROUPS[1]:
-                files.append(item)
+    def _scandir_recursive(self, path: str, exclude_dirs: Set[str]) -> Iterator[os.DirEntry]:
+        """
+        Yield a DirEntry for every regular file below path.
 
-        return files
+        Excluded directories are pruned before descending into them, and file
+        types come from the cached readdir result, so no extra stat() calls are
+        needed. Symlinks are not followed.
+        """
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name in exclude_dirs:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._scandir_recursive(entry.path, exclude_dirs)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
 
     def _prioritize_files(self, files: List[Path], repo_path: Path) -> List[Path]:
         """
@@ -122,46 +175,44 @@ class MarkdownCorpusBuilder(MarkdownCorpusPort):
         4. Documentation and scripts
         5. Frontend files
         """
-        prioritized = []
-
-        # Priority 1: Special files (README, LICENSE, etc.)
-        priority_1 = [f for f in files if f.name in self.PRIORITY_GROUPS[1]]
-        prioritized.extend(sorted(priority_1, key=lambda x: x.name))
-
-        # Priority 2: Application code
-        priority_2 = [f for f in files if f.suffix in self.PRIORITY_GROUPS[2] and f not in priority_1]
-        prioritized.extend(sorted(priority_2, key=lambda x: (len(x.parts), x.name)))
-
-        # Priority 3: Configuration
-        priority_3 = [f for f in files if f.suffix in self.PRIORITY_GROUPS[3] and f not in priority_1]
-        prioritized.extend(sorted(priority_3, key=lambda x: (len(x.parts), x.name)))
-
-        # Priority 4: Documentation and scripts
-        priority_4 = [f for f in files if f.suffix in self.PRIORITY_GROUPS[4] and f not in priority_1]
-        prioritized.extend(sorted(priority_4, key=lambda x: (len(x.parts), x.name)))
-
-        # Priority 5: Frontend
-        priority_5 = [f for f in files if f.suffix in self.PRIORITY_GROUPS[5] and f not in priority_1]
-        prioritized.extend(sorted(priority_5, key=lambda x: (len(x.parts), x.name)))
-
-        # Remaining files
-        remaining = [f for f in files if f not in prioritized]
-        prioritized.extend(sorted(remaining, key=lambda x: (len(x.parts), x.name)))
+        # Assign every file to its group in a single pass
+        buckets = {group: [] for group in range(1, self.REMAINING_GROUP + 1)}
+        special_names = self.PRIORITY_GROUPS[1]
+
+        for f in files:
+            if f.name in special_names:
+                group = 1
+            else:
+                group = self.PRIORITY_BY_SUFFIX.get(f.suffix, self.REMAINING_GROUP)
+            buckets[group].append(f)
+
+        # Special files (README, LICENSE, etc.) by name, all other groups by depth and name
+        # (depth is counted on the path string instead of splitting it into parts)
+        prioritized = sorted(buckets.pop(1), key=lambda x: x.name)
+        for group_files in buckets.values():
+            prioritized.extend(sorted(group_files, key=lambda x: (os.fspath(x).count(os.sep), x.name)))
 
         return prioritized
 
-    def _generate_output_path(self, repo_path: Path, output_dir: Path = None) -> Path:
+    def _generate_output_path(
+        self,
+        repo_path: Path,
+        output_dir: Path = None,
+        generated_at: Optional[datetime] = None
+    ) -> Path:
         """
         Generate output path with timestamp.
 
         Args:
             repo_path: Path to repository
             output_dir: Directory where file should be saved (default: repo_path)
+            generated_at: UTC generation time (default: now)
 
         Returns:
             Path to output file with format: {repo_name}_{timestamp}.html
         """
-        timestamp = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
+        generated_at = generated_at or datetime.now(timezone.utc)
+        timestamp = generated_at.strftime('%Y%m%dT%H%M%SZ')
         filename = f"{repo_path.name}_{timestamp}.html"
 
         if output_dir:
@@ -179,101 +230,211 @@ class MarkdownCorpusBuilder(MarkdownCorpusPort):
         files: List[Path],
         repo_path: Path,
         output_path: Path,
-        max_bytes: int
+        max_bytes: int,
+        file_sizes: Optional[Dict[Path, int]] = None,
+        generated_at: Optional[datetime] = None
     ) -> Tuple[int, int, bool]:
         """
         Write markdown corpus with size limit.
 
+        Files are added in the given order; a file that does not fit into the
+        remaining budget is skipped without being read, and smaller files after
+        it are still added. The next files are read in worker threads while the
+        current one is written.
+
+        Args:
+            files: Files in priority order
+            repo_path: Path to repository
+            output_path: Path of the corpus file
+            max_bytes: Maximum size in bytes
+            file_sizes: File sizes from collection (files missing here are stat'ed)
+            generated_at: UTC generation time for the header (default: now)
+
         Returns:
             Tuple of (file_count, total_size, is_complete)
         """
+        file_sizes = file_sizes or {}
+        generated_at = generated_at or datetime.now(timezone.utc)
         current_size = 0
         file_count = 0
         is_complete = True
 
-        with open(output_path, 'w', encoding='utf-8') as md_file:
+        # Every chunk is encoded once; its byte length is the size accounted for
+        with open(output_path, 'wb', buffering=1 << 20) as md_file:
             # Header
-            header = f"# Repository: {repo_path.name}\n\n"
-            header += f"Generated: {datetime.utcnow().isoformat()}\n\n"
-            header += "## Directory Structure\n\n"
-            md_file.write(header)
-            current_size += len(header.encode('utf-8'))
+            header = "".join([
+                f"# Repository: {repo_path.name}\n\n",
+                f"Generated: {generated_at.isoformat()}\n\n",
+                "## Directory Structure\n\n",
+            ]).encode('utf-8')
+            current_size += md_file.write(header)
 
             # Directory tree
-            tree = self._generate_tree(files, repo_path)
-            md_file.write(tree)
-            md_file.write("\n\n")
-            current_size += len(tree.encode('utf-8'))
+            tree = self._generate_tree(files, repo_path).encode('utf-8')
+            current_size += md_file.write(tree)
+            md_file.write(b"\n\n")
 
             # File contents
-            md_file.write("## File Contents\n\n")
-            current_size += len("## File Contents\n\n".encode('utf-8'))
-
-            for file_path in files:
-                # Check size limit
-                if current_size >= max_bytes:
-                    is_complete = False
-                    break
-
-                try:
-                    # Read file content
-                    content = file_path.read_text(encoding='utf-8', errors='ignore')
-
-                    # Generate markdown section
-                    rel_path = file_path.relative_to(repo_path)
-                    section = f"### {rel_path}\n\n"
-                    section += f"```{file_path.suffix[1:]}\n"
-                    section += content
-                    section += "\n```\n\n"
-
-                    section_size = len(section.encode('utf-8'))
-
-                    # Check if adding this file would exceed limit
-                    if current_size + section_size > max_bytes:
+            current_size += md_file.write(b"## File Contents\n\n")
+
+            # Relative paths are sliced from the path string instead of built as Paths
+            prefix = os.path.join(os.fspath(repo_path), "")
+            section_tail = self.SECTION_TAIL
+
+            with ThreadPoolExecutor(max_workers=self.PREFETCH_WORKERS) as executor:
+                pending = deque()
+                upcoming = iter(files)
+
+                def prefetch() -> None:
+                    # Keep the window full; the budget only shrinks, so files that
+                    # already cannot fit are never read
+                    while len(pending) < self.PREFETCH_WINDOW:
+                        file_path = next(upcoming, None)
+                        if file_path is None:
+                            return
+                        size = file_sizes.get(file_path)
+                        future = None
+                        if size is None or current_size + size <= max_bytes:
+                            future = executor.submit(self._read_source, file_path)
+                        pending.append((file_path, future))
+
+                prefetch()
+                while pending:
+                    file_path, future = pending.popleft()
+
+                    # Check size limit
+                    if current_size >= max_bytes:
                         is_complete = False
                         break
 
-                    md_file.write(section)
-                    current_size += section_size
-                    file_count += 1
-
-                except Exception as e:
-                    logger.warning(f"Could not read file {file_path}: {e}")
-                    continue
+                    try:
+                        # Generate markdown section around the file content
+                        rel_path = self._relative_path(file_path, prefix)
+                        section_head = f"### {rel_path}\n\n```{file_path.suffix[1:]}\n".encode('utf-8')
+                        overhead = len(section_head) + len(section_tail)
+
+                        # The raw file size is an upper bound for the written content
+                        # (decoding with errors='ignore' and newline translation only
+                        # shrink it); skip files that may not fit without waiting for them
+                        size = file_sizes.get(file_path)
+                        if size is None:
+                            size = file_path.stat().st_size
+                        if future is None or current_size + overhead + size > max_bytes:
+                            is_complete = False
+                            continue
+
+                        data = future.result()
+                        if data is None:
+                            logger.debug(f"Skipping binary file {file_path}")
+                            continue
+
+                        # Hand the parts to the buffer as-is; joining them would copy the content again
+                        content = self._decode_source(data)
+                        md_file.writelines((section_head, content, section_tail))
+                        current_size += overhead + len(content)
+                        file_count += 1
+
+                    except Exception as e:
+                        logger.warning(f"Could not read file {file_path}: {e}")
+                        continue
+
+                    finally:
+                        prefetch()
+
+                # Do not read files that will not be written
+                for _, future in pending:
+                    if future is not None:
+                        future.cancel()
 
             # Add note if incomplete
             if not is_complete:
-                note = "\n\n---\n**Note**: Size limit reached. Not all files included.\n"
-                md_file.write(note)
-                current_size += len(note.encode('utf-8'))
+                note = b"\n\n---\n**Note**: Size limit reached. Not all files included.\n"
+                current_size += md_file.write(note)
 
         return file_count, current_size, is_complete
 
+    def _read_source(self, file_path: Path) -> Optional[bytes]:
+        """Read a file's bytes, or return None if its first bytes look binary."""
+        with open(file_path, 'rb') as f:
+            head = f.read(self.BINARY_SNIFF_BYTES)
+            if b'\x00' in head:
+                return None
+            control = len(head.translate(None, self._NON_CONTROL_BYTES))
+            if head and control / len(head) > self.BINARY_CONTROL_RATIO:
+                return None
+            return head + f.read()
+
+    @staticmethod
+    def _decode_source(data: bytes) -> bytes:
+        """Decode file bytes like a UTF-8 text read (errors ignored, universal newlines) and re-encode them."""
+        # Valid UTF-8 without carriage returns is unchanged by the roundtrip
+        if b'\r' not in data:
+            if data.isascii():
+                return data
+            try:
+                data.decode('utf-8')
+                return data
+            except UnicodeDecodeError:
+                pass
+
+        text = data.decode('utf-8', errors='ignore')
+        return text.replace('\r\n', '\n').replace('\r', '\n').encode('utf-8')
+
+    @staticmethod
+    def _relative_path(file_path: Path, prefix: str) -> str:
+        """
+        Return the path of file_path relative to the repository root.
+
+        Args:
+            file_path: File inside the repository
+            prefix: Repository root path ending with a separator
+
+        Returns:
+            Relative path string
+        """
+        path = os.fspath(file_path)
+        if path.startswith(prefix):
+            return path[len(prefix):]
+        # Root and file were spelled differently (e.g. relative root "./")
+        return os.path.relpath(path, prefix)
+
     def _generate_tree(self, files: List[Path], repo_path: Path) -> str:
         """Generate simple directory tree."""
         tree_lines = ["```"]
         tree_lines.append(str(repo_path.name) + "/")
 
-        # Group by directory
-        dirs = set()
-        for file_path in files:
-            rel_path = file_path.relative_to(repo_path)
-            for parent in rel_path.parents:
-                if parent != Path('.'):
-                    dirs.add(parent)
+        # Relative path components of every file, split once from the path string
+        prefix = os.path.join(os.fspath(repo_path), "")
+        file_parts = [tuple(self._relative_path(file_path, prefix).split(os.sep)) for file_path in files]
 
-        # Sort directories
-        sorted_dirs = sorted(dirs, key=lambda x: (len(x.parts), str(x)))
+        # Nest files into a dict-trie; directories map to dicts, files to None
+        root = {}
+        for parts in file_parts:
+            node = root
+            for part in parts[:-1]:
+                node = node.setdefault(part, {})
+            node[parts[-1]] = None
 
-        for dir_path in sorted_dirs:
-            indent = "  " * len(dir_path.parts)
-            tree_lines.append(f"{indent}{dir_path.name}/")
-
-        # Add files
-        for file_path in sorted(files, key=lambda x: (x.parent, x.name)):
-            rel_path = file_path.relative_to(repo_path)
-            indent = "  " * len(rel_path.parts)
-            tree_lines.append(f"{indent}{rel_path.name}")
+        self._emit_tree(root, 1, tree_lines)
 
         tree_lines.append("```")
         return "\n".join(tree_lines)
+
+    def _emit_tree(self, node: Dict[str, Optional[dict]], depth: int, tree_lines: List[str]) -> None:
+        """Append the entries of a tree node, directories first, each sorted by name."""
+        indent = "  " * depth
+
+        # Partition entries in one pass, then sort each part in place
+        dir_names = []
+        file_names = []
+        for name, child in node.items():
+            (file_names if child is None else dir_names).append(name)
+        dir_names.sort()
+        file_names.sort()
+
+        for name in dir_names:
+            tree_lines.append(f"{indent}{name}/")
+            self._emit_tree(node[name], depth + 1, tree_lines)
+
+        for name in file_names:
+            tree_lines.append(f"{indent}{name}")
@@ -3,11 +3,11 @@ Repository mirror adapter for copying source code locally.
 Uses testdata if available, otherwise would clone from Git.
 """
 import logging
-import shutil
 from pathlib import Path
 
 from django.conf import settings
 
+from adapters.git_platform.fs_utils import replace_tree
 from domain.ports import RepositoryMirrorPort
 
 logger = logging.getLogger(__name__)
@@ -64,14 +64,9 @@ class LocalMirrorAdapter(RepositoryMirrorPort):
         # Create target directory if it doesn't exist
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        # Remove existing if present
-        if target_path.exists():
-            logger.info(f"Removing existing mirror at {target_path}")
-            shutil.rmtree(target_path)
-
-        # Copy repository
+        # Copy repository; files are hardlinked on the same filesystem
         logger.info(f"Copying repository from {source_path} to {target_path}")
-        shutil.copytree(source_path, target_path)
+        replace_tree(source_path, target_path, link_files=True)
 
         logger.info(f"Repository {repo_name} mirrored to {target_path}")
         return target_path
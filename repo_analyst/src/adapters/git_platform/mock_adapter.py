@@ -3,14 +3,15 @@ Mock adapter for source code repository operations.
 Uses TSV file for repository listing and local testdata for cloning.
 """
 import csv
+import functools
 import logging
-import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
 from dateutil import parser as date_parser
 
+from adapters.git_platform.fs_utils import replace_tree
 from domain.entities import RepositoryDTO
 from domain.ports import SourceCodeRepositoryPort
 
@@ -36,6 +37,10 @@ class MockSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
         self.csv_path = csv_path
         self.testdata_repos_root = testdata_repos_root
 
+        # Parsed repositories and the file mtime they were parsed from
+        self._repositories: List[RepositoryDTO] = []
+        self._cache_key: Optional[int] = None
+
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
@@ -54,37 +59,73 @@ class MockSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
         """
         page = int(page_token) if page_token else 1
         logger.info(f"Reading repositories from {self.csv_path} (page={page}, page_size={page_size})")
-        all_repositories = []
+
+        # Parse the file once per modification; later pages are list slices
+        mtime_ns = self.csv_path.stat().st_mtime_ns
+        if self._cache_key != mtime_ns:
+            self._repositories = self._parse_all()
+            self._cache_key = mtime_ns
+
+        # Apply pagination
+        start_idx = (page - 1) * page_size
+        end_idx = start_idx + page_size
+        paginated_repositories = self._repositories[start_idx:end_idx]
+
+        logger.info(
+            f"Loaded {len(self._repositories)} total repositories, "
+            f"returning {len(paginated_repositories)} for page {page}"
+        )
+        return paginated_repositories
+
+    def _parse_all(self) -> List[RepositoryDTO]:
+        """
+        Parse all repositories from the TSV file.
+
+        Returns:
+            List of RepositoryDTO objects for all valid rows
+        """
+        repositories = []
 
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as f:
+            with open(self.csv_path, 'r', encoding='utf-8', newline='') as f:
                 # TSV file with TAB delimiter
-                reader = csv.DictReader(f, delimiter='\t')
+                reader = csv.reader(f, delimiter='\t')
+                header = next(reader, [])
+                idx = {name: i for i, name in enumerate(header)}
+
+                def field(row: List[str], name: str, default: str = '') -> str:
+                    # Optional columns may be missing from the header
+                    i = idx.get(name)
+                    return row[i] if i is not None else default
 
                 for row in reader:
+                    # Skip blank lines like DictReader does
+                    if not row:
+                        continue
+
                     try:
                         # Parse is_active (convert to boolean)
-                        is_active_str = row.get('is_active', '1').strip()
+                        is_active_str = field(row, 'is_active', '1').strip()
                         is_active = is_active_str in ('1', 'true', 'True', 'yes')
 
                         # Parse dates with flexible format
-                        created_at = self._parse_date(row.get('created_at', ''))
-                        updated_at = self._parse_date(row.get('updated_at', ''))
+                        created_at = self._parse_date(field(row, 'created_at'))
+                        updated_at = self._parse_date(field(row, 'updated_at'))
 
                         # Create DTO
                         repo = RepositoryDTO(
-                            external_id=row['external_id'].strip(),
-                            name=row['name'].strip(),
-                            url=row['web_url'].strip(),
-                            description=row.get('description', '').strip(),
-                            namespace_path=row.get('namespace_path', '').strip(),
-                            visibility=row.get('visibility', 'internal').strip(),
+                            external_id=row[idx['external_id']].strip(),
+                            name=row[idx['name']].strip(),
+                            url=row[idx['web_url']].strip(),
+                            description=field(row, 'description').strip(),
+                            namespace_path=field(row, 'namespace_path').strip(),
+                            visibility=field(row, 'visibility', 'internal').strip(),
                             is_active=is_active,
                             created_at=created_at,
                             updated_at=updated_at,
                         )
 
-                        all_repositories.append(repo)
+                        repositories.append(repo)
                         logger.debug(f"Parsed repository: {repo.name}")
 
                     except Exception as e:
@@ -95,16 +136,7 @@ class MockSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
             logger.error(f"Error reading CSV file: {e}")
             raise
 
-        # Apply pagination
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_repositories = all_repositories[start_idx:end_idx]
-
-        logger.info(
-            f"Loaded {len(all_repositories)} total repositories, "
-            f"returning {len(paginated_repositories)} for page {page}"
-        )
-        return paginated_repositories
+        return repositories
 
     def clone_repository(self, repo_name: str, repo_url: str, namespace_path: str, target_dir: Path) -> Path:
         """
@@ -142,12 +174,11 @@ class MockSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
         target_path = target_dir / namespace_path
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Copy repository
+        # Copy repository, replacing an existing copy
         if target_path.exists():
-            logger.warning(f"Target path already exists, removing: {target_path}")
-            shutil.rmtree(target_path)
+            logger.warning(f"Target path already exists, replacing: {target_path}")
 
-        shutil.copytree(source_path, target_path)
+        replace_tree(source_path, target_path, link_files=True)
         logger.info(f"Repository cloned from {source_path} to {target_path}")
 
         return target_path
@@ -181,10 +212,31 @@ class MockSourceCodeRepositoryAdapter(SourceCodeRepositoryPort):
         if not date_str or not date_str.strip():
             return None
 
-        try:
-            # Use dateutil parser for flexible parsing
-            dt = date_parser.parse(date_str)
-            return dt
-        except Exception as e:
-            logger.warning(f"Could not parse date '{date_str}': {e}")
-            return None
+        return _parse_date_cached(date_str.strip())
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """
+    Parse a non-empty date string, memoized by the raw string.
+
+    Rows of bulk imports often share identical timestamps.
+
+    Args:
+        date_str: Stripped date string to parse
+
+    Returns:
+        datetime object or None
+    """
+    try:
+        # Fast path: ISO-8601
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+
+    try:
+        # Use dateutil parser for flexible parsing
+        return date_parser.parse(date_str)
+    except Exception as e:
+        logger.warning(f"Could not parse date '{date_str}': {e}")
+        return None
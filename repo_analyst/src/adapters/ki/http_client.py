@@ -2,16 +2,47 @@
 HTTP-based KI/AI client adapter.
 Generic adapter for HTTP-based AI APIs (OpenAI, Anthropic, Azure, etc.)
 """
+import json
 import logging
 import os
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from adapters.ki.response_cache import ResponseCache, SemanticResponseCache, response_cache_key
 from domain.ports import KIClientPort
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool for the provider endpoint
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+
+# Transient responses that are retried with exponential backoff
+RETRY_STATUS_CODES = (408, 409, 425, 429, 500, 502, 503, 504)
+MAX_RETRIES = 5
+RETRY_BACKOFF_FACTOR = 0.5
+
+# Completion token limit per answer (bundled requests get one per prompt)
+MAX_TOKENS_PER_ANSWER = 2000
+
+# Timeout of the best-effort connection warm-up request
+WARM_UP_TIMEOUT_S = 5
+
+# System message sent with every request; kept constant so it forms a cacheable prefix
+SYSTEM_PREAMBLE = (
+    "You are a software architecture analyst. "
+    "Answer the task using the repository context provided."
+)
+
+# Environment variables already reported as missing, so each is warned about once
+_missing_token_vars = set()
+_missing_token_lock = threading.Lock()
+
 
 class HTTPKIClient(KIClientPort):
     """
@@ -24,22 +55,90 @@ class HTTPKIClient(KIClientPort):
         base_url: str,
         model_name: str,
         auth_token_env_var: str,
-        timeout_s: int = 30
+        timeout_s: int = 30,
+        max_concurrency: int = 8,
+        temperature: float = 0.7,
+        cache: Optional[ResponseCache] = None,
+        cache_ttl_s: Optional[int] = 3600,
+        semantic_cache: Optional[SemanticResponseCache] = None,
+        warm_up: bool = True
     ):
         self.base_url = base_url
         self.model_name = model_name
         self.auth_token_env_var = auth_token_env_var
         self.timeout_s = timeout_s
+        # Upper bound for parallel requests in analyze_many (provider rate limits)
+        self.max_concurrency = max_concurrency
+        self.temperature = temperature
+
+        # Responses are only cached for deterministic requests
+        self.cache = cache if temperature == 0 else None
+        self.cache_ttl_s = cache_ttl_s
+        self.semantic_cache = semantic_cache if temperature == 0 else None
+        self.cache_stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
+        self._stats_lock = threading.Lock()
+        if temperature != 0 and (cache is not None or semantic_cache is not None):
+            logger.info(f"Response caches disabled for non-zero temperature {temperature}")
 
         # Get token from environment
         self.auth_token = os.getenv(auth_token_env_var)
         if not self.auth_token:
-            logger.warning(f"Auth token not found in environment: {auth_token_env_var}")
+            with _missing_token_lock:
+                first_miss = auth_token_env_var not in _missing_token_vars
+                _missing_token_vars.add(auth_token_env_var)
+            if first_miss:
+                logger.warning(f"Auth token not found in environment: {auth_token_env_var}")
+
+        # Persistent session so consecutive prompts reuse the TCP/TLS connection
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        if self.auth_token:
+            self.session.headers["Authorization"] = f"Bearer {self.auth_token}"
+
+        # POST is retried only for connection errors and transient statuses, not
+        # after read timeouts, so a slow completion is not requested again.
+        # Retry-After of rate-limited responses takes precedence over the backoff
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=MAX_RETRIES,
+                read=0,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset({"POST"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Open the first pooled connection (TCP + TLS handshake) in the background,
+        # so the first prompt does not pay for it
+        if warm_up:
+            threading.Thread(target=self._warm_up, daemon=True).start()
+
+    def _warm_up(self) -> None:
+        """Send a HEAD request to the endpoint; failures are ignored."""
+        try:
+            self.session.head(self.base_url, timeout=WARM_UP_TIMEOUT_S).close()
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Connection warm-up for {self.base_url} failed: {e}")
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
 
     def analyze(self, prompt_text: str, context: str = "") -> dict:
         """
         Send analysis request to KI provider.
 
+        The request starts with the constant system preamble, followed by the
+        context and only then the prompt. Requests with the same context thus
+        share a byte-identical prefix that providers can serve from their prompt
+        cache; keep variable content out of the preamble and the context.
+
         Args:
             prompt_text: The prompt to send
             context: Additional context (e.g., code corpus)
@@ -47,46 +146,203 @@ class HTTPKIClient(KIClientPort):
         Returns:
             Dictionary with analysis results
         """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = response_cache_key(self.model_name, prompt_text, context, self.temperature)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self._count_cache_lookup("hits")
+                logger.info(f"Answering prompt from response cache (model: {self.model_name})")
+                return cached
+
+        # Near-duplicate prompts on the same context
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.get(prompt_text, context)
+            if cached is not None:
+                self._count_cache_lookup("semantic_hits")
+                logger.info(f"Answering prompt from semantic cache (model: {self.model_name})")
+                return cached
+
+        if self.cache is not None or self.semantic_cache is not None:
+            self._count_cache_lookup("misses")
+
         logger.info(f"Sending prompt to {self.base_url} (model: {self.model_name})")
 
-        # Build request payload (generic format)
-        full_prompt = f"{prompt_text}\n\nContext:\n{context}" if context else prompt_text
+        # Static context first, variable task last
+        full_prompt = f"Context:\n{context}\n\nTask:\n{prompt_text}" if context else prompt_text
+
+        try:
+            result = self._post_chat(full_prompt)
+            logger.info("Received response from KI provider")
+
+            # Extract response (format may vary by provider)
+            parsed = self._parse_response(result)
+
+            # Fallback responses after errors are never cached
+            if cache_key is not None:
+                self.cache.set(cache_key, parsed, timeout=self.cache_ttl_s)
+            if self.semantic_cache is not None:
+                self.semantic_cache.set(prompt_text, context, parsed)
+
+            return parsed
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error calling KI provider: {e}")
+            # Return mock response for development
+            return self._mock_response()
+
+    def analyze_many(self, items: List[Tuple[str, str]]) -> List[dict]:
+        """
+        Send several analysis requests concurrently.
+
+        Requests run in a thread pool of at most max_concurrency workers and share
+        the pooled session, so network and provider time overlap.
+
+        Args:
+            items: (prompt_text, context) pairs
+
+        Returns:
+            Analysis results in the order of items
+        """
+        if not items:
+            return []
+
+        workers = min(self.max_concurrency, len(items))
+        logger.info(f"Sending {len(items)} prompts to {self.base_url} with {workers} workers")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda item: self.analyze(*item), items))
+
+    def analyze_bundle(self, prompts: List[str], context: str = "") -> List[dict]:
+        """
+        Answer several prompts on the same context with a single request.
+
+        The shared context comes first so providers can reuse their prompt cache,
+        followed by the numbered prompts; the model is asked for a JSON array with
+        one answer per prompt. If the request fails or the answer cannot be
+        matched to the prompts, they are sent individually instead.
 
+        Args:
+            prompts: Prompts to answer
+            context: Context shared by all prompts
+
+        Returns:
+            Analysis results in the order of prompts
+        """
+        if len(prompts) <= 1:
+            return [self.analyze(prompt_text, context) for prompt_text in prompts]
+
+        logger.info(f"Sending {len(prompts)} bundled prompts to {self.base_url} (model: {self.model_name})")
+
+        answers = None
+        try:
+            result = self._post_chat(
+                self._bundle_prompt(prompts, context),
+                max_tokens=MAX_TOKENS_PER_ANSWER * len(prompts)
+            )
+            answers = self._split_bundle_answers(self._extract_content(result), len(prompts))
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error calling KI provider: {e}")
+
+        if answers is None:
+            logger.warning("Bundled request gave no usable answers, sending prompts individually")
+            return self.analyze_many([(prompt_text, context) for prompt_text in prompts])
+
+        return [self._parse_response({"content": answer}) for answer in answers]
+
+    def _post_chat(self, content: str, max_tokens: int = MAX_TOKENS_PER_ANSWER) -> dict:
+        """
+        Send one chat message and return the decoded JSON response.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        # Build request payload (generic format)
         payload = {
             "model": self.model_name,
             "messages": [
-                {"role": "user", "content": full_prompt}
+                {"role": "system", "content": SYSTEM_PREAMBLE},
+                {"role": "user", "content": content}
             ],
-            "temperature": 0.7,
-            "max_tokens": 2000,
+            "temperature": self.temperature,
+            "max_tokens": max_tokens,
         }
 
-        headers = {
-            "Content-Type": "application/json",
-        }
+        # Compact UTF-8 body; non-ASCII text (e.g. German prompts) is not \u-escaped
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
 
-        if self.auth_token:
-            headers["Authorization"] = f"Bearer {self.auth_token}"
+        response = self.session.post(
+            self.base_url,
+            data=body,
+            timeout=self.timeout_s
+        )
+        if not response.ok:
+            # Retries are exhausted at this point; the fallback response follows
+            retries = getattr(response.raw, "retries", None)
+            attempts = len(retries.history) + 1 if retries is not None else 1
+            logger.warning(
+                f"KI provider answered HTTP {response.status_code} after {attempts} attempt(s) "
+                f"(model: {self.model_name})"
+            )
+        response.raise_for_status()
+        # json.loads detects the UTF encoding of the body bytes itself, which
+        # avoids the decoded text copy (and charset guessing) of response.json()
+        try:
+            return json.loads(response.content)
+        except ValueError as e:
+            raise requests.exceptions.InvalidJSONError(f"Invalid JSON in provider response: {e}") from e
+
+    @staticmethod
+    def _bundle_prompt(prompts: List[str], context: str) -> str:
+        """Build one message asking for a JSON array with an answer per numbered prompt."""
+        parts = []
+        if context:
+            parts.append(f"Context:\n{context}")
+        parts.append(
+            f"Answer each of the following {len(prompts)} tasks. Respond only with a JSON array "
+            'containing one object {"id": <task number>, "answer": <answer text>} per task.'
+        )
+        for number, prompt_text in enumerate(prompts, start=1):
+            parts.append(f"Task {number}:\n{prompt_text}")
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def _split_bundle_answers(content: str, count: int) -> Optional[List[str]]:
+        """
+        Extract the answers of a bundled response in task order.
+
+        Returns:
+            One answer per task, or None if the response is not a JSON array
+            answering exactly the tasks 1..count
+        """
+        text = content.strip()
+        # Models often wrap JSON in a markdown code fence
+        if text.startswith("```"):
+            text = text.partition("\n")[2].rsplit("```", 1)[0]
 
         try:
-            response = requests.post(
-                self.base_url,
-                json=payload,
-                headers=headers,
-                timeout=self.timeout_s
-            )
-            response.raise_for_status()
+            items = json.loads(text)
+        except ValueError:
+            return None
+        if not isinstance(items, list):
+            return None
 
-            result = response.json()
-            logger.info("Received response from KI provider")
+        answers = {}
+        for item in items:
+            if isinstance(item, dict) and isinstance(item.get("id"), int) and "answer" in item:
+                answers[item["id"]] = item["answer"]
+        if set(answers) != set(range(1, count + 1)):
+            return None
 
-            # Extract response (format may vary by provider)
-            return self._parse_response(result)
+        return [
+            answer if isinstance(answer, str) else json.dumps(answer)
+            for answer in (answers[number] for number in range(1, count + 1))
+        ]
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling KI provider: {e}")
-            # Return mock response for development
-            return self._mock_response()
+    def _count_cache_lookup(self, outcome: str) -> None:
+        """Record a cache lookup outcome ("hits", "semantic_hits" or "misses") in cache_stats."""
+        with self._stats_lock:
+            self.cache_stats[outcome] += 1
 
     def _parse_response(self, result: dict) -> dict:
         """
@@ -100,18 +356,7 @@ class HTTPKIClient(KIClientPort):
             "endpoints": dict (optional)
         }
         """
-        # Try to extract content from various response formats
-        content = ""
-
-        # OpenAI format
-        if "choices" in result:
-            content = result["choices"][0]["message"]["content"]
-        # Generic format
-        elif "content" in result:
-            content = result["content"]
-        # Raw text
-        elif isinstance(result, str):
-            content = result
+        content = self._extract_content(result)
 
         # For now, return structured mock data
         # In production, would parse actual AI response
@@ -130,6 +375,20 @@ class HTTPKIClient(KIClientPort):
             "endpoints": {}
         }
 
+    @staticmethod
+    def _extract_content(result) -> str:
+        """Extract the answer text from various provider response formats."""
+        # OpenAI format
+        if "choices" in result:
+            return result["choices"][0]["message"]["content"]
+        # Generic format
+        if "content" in result:
+            return result["content"]
+        # Raw text
+        if isinstance(result, str):
+            return result
+        return ""
+
     def _mock_response(self) -> dict:
         """Return mock response for development/testing."""
         return {
@@ -0,0 +1,215 @@
+"""
+Response caches for KI clients.
+Deterministic requests (temperature 0) with identical or near-identical input are
+answered from the cache.
+"""
+import copy
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence
+
+# Word tokens for the built-in prompt embedding
+TOKEN_RE = re.compile(r"\w+")
+
+# Dimension of the built-in hashed bag-of-words embedding
+EMBEDDING_DIM = 384
+
+
+def response_cache_key(model_name: str, prompt_text: str, context: str, temperature: float) -> str:
+    """
+    Build the cache key for a request.
+
+    Args:
+        model_name: Model the request is sent to
+        prompt_text: The prompt
+        context: Additional context
+        temperature: Sampling temperature
+
+    Returns:
+        Hex SHA-256 digest of the canonical request
+    """
+    payload = json.dumps(
+        {"model": model_name, "prompt": prompt_text, "context": context, "temperature": temperature},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache(ABC):
+    """Storage for parsed KI responses."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached response for key, or None."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: dict, timeout: Optional[int] = None) -> None:
+        """Store a response for timeout seconds (None: no expiry)."""
+        pass
+
+
+class MemoryResponseCache(ResponseCache):
+    """
+    In-process LRU cache with per-entry expiry.
+    Thread-safe, so it can back concurrent analyze_many calls.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Callers may modify the result; keep the cached copy intact
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: dict, timeout: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + timeout if timeout is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DjangoResponseCache(ResponseCache):
+    """Cache backed by Django's cache framework (e.g. Redis or memcached)."""
+
+    def __init__(self, alias: str = "default", key_prefix: str = "ki-response:"):
+        from django.core.cache import caches
+
+        self._cache = caches[alias]
+        self.key_prefix = key_prefix
+
+    def get(self, key: str) -> Optional[dict]:
+        return self._cache.get(self.key_prefix + key)
+
+    def set(self, key: str, value: dict, timeout: Optional[int] = None) -> None:
+        self._cache.set(self.key_prefix + key, value, timeout=timeout)
+
+
+def hashed_bow_embedding(text: str, dim: int = EMBEDDING_DIM) -> List[float]:
+    """
+    Embed text as hashed word counts.
+
+    A dependency-free stand-in for a sentence embedding model: prompts that share
+    most of their words get a high cosine similarity.
+
+    Args:
+        text: Text to embed
+        dim: Vector dimension
+
+    Returns:
+        Term-count vector of length dim
+    """
+    vector = [0.0] * dim
+    for token in TOKEN_RE.findall(text.lower()):
+        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+        vector[int.from_bytes(digest, "little") % dim] += 1.0
+    return vector
+
+
+class SemanticResponseCache:
+    """
+    Cache that answers prompts similar to an earlier prompt on the same context.
+
+    Prompts are compared by cosine similarity of their embeddings; the context
+    must match exactly, since contexts of different repositories differ only in
+    a few words. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]] = hashed_bow_embedding,
+        threshold: float = 0.92,
+        max_entries: int = 512,
+        ttl_s: Optional[int] = 3600
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embed: Function mapping a prompt to a vector (e.g. a sentence-transformers encoder)
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum number of cached responses (least recently used are evicted)
+            ttl_s: Lifetime of an entry in seconds (None: no expiry)
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def get(self, prompt_text: str, context: str) -> Optional[dict]:
+        """Return the response of the most similar cached prompt, or None."""
+        query = self._unit_vector(prompt_text)
+        if query is None:
+            return None
+        context_key = self._context_key(context)
+        now = time.monotonic()
+
+        with self._lock:
+            best_id, best_score = None, self.threshold
+            for entry_id, (entry_context, vector, expires_at, _) in list(self._entries.items()):
+                if expires_at is not None and expires_at <= now:
+                    del self._entries[entry_id]
+                    continue
+                if entry_context != context_key:
+                    continue
+                score = sum(map(float.__mul__, query, vector))
+                if score >= best_score:
+                    best_id, best_score = entry_id, score
+
+            if best_id is None:
+                return None
+            self._entries.move_to_end(best_id)
+            value = self._entries[best_id][3]
+
+        # Callers may modify the result; keep the cached copy intact
+        return copy.deepcopy(value)
+
+    def set(self, prompt_text: str, context: str, value: dict) -> None:
+        """Store the response for a prompt and context."""
+        vector = self._unit_vector(prompt_text)
+        if vector is None:
+            return
+        expires_at = time.monotonic() + self.ttl_s if self.ttl_s is not None else None
+        entry = (self._context_key(context), vector, expires_at, copy.deepcopy(value))
+
+        with self._lock:
+            self._entries[self._next_id] = entry
+            self._next_id += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _unit_vector(self, text: str) -> Optional[List[float]]:
+        """Embed text and normalize the vector; None for texts without content."""
+        vector = [float(x) for x in self.embed(text)]
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm == 0:
+            return None
+        return [x / norm for x in vector]
+
+    @staticmethod
+    def _context_key(context: str) -> str:
+        """Digest identifying a context."""
+        return hashlib.sha256(context.encode("utf-8")).hexdigest()
@@ -2,9 +2,22 @@
 Django admin configuration for Repo-Analyst models.
 """
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 
 from .models import ART, Application, AppSettings, KIProvider, MarkdownCorpus, Prompt, PromptRun, Repository
 
+# PromptRun fields with request/response payloads, not shown in the list view
+PROMPT_RUN_PAYLOAD_FIELDS = (
+    "request_text", "response_json", "summary", "improvement_suggestions", "endpoints",
+)
+
+
+class PromptRunChangeList(ChangeList):
+    """Change list that does not load the payload fields of the listed runs."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return super().get_queryset(request, exclude_parameters).defer(*PROMPT_RUN_PAYLOAD_FIELDS)
+
 
 @admin.register(ART)
 class ARTAdmin(admin.ModelAdmin):
@@ -17,6 +30,7 @@ class ARTAdmin(admin.ModelAdmin):
 class ApplicationAdmin(admin.ModelAdmin):
     list_display = ["name", "alphabet_id", "art", "created_at"]
     list_filter = ["art"]
+    list_select_related = ["art"]
     search_fields = ["name", "alphabet_id", "description"]
     ordering = ["name"]
 
@@ -25,6 +39,7 @@ class ApplicationAdmin(admin.ModelAdmin):
 class RepositoryAdmin(admin.ModelAdmin):
     list_display = ["name", "namespace_path", "external_id", "is_active", "application", "updated_at"]
     list_filter = ["is_active", "visibility", "application__art"]
+    list_select_related = ["application"]
     search_fields = ["name", "namespace_path", "external_id", "description"]
     ordering = ["-updated_at"]
     readonly_fields = ["created_at", "updated_at"]
@@ -50,18 +65,23 @@ class KIProviderAdmin(admin.ModelAdmin):
 class PromptRunAdmin(admin.ModelAdmin):
     list_display = ["repository", "prompt", "ki_provider", "score_pct", "created_at"]
     list_filter = ["prompt", "ki_provider", "created_at"]
+    list_select_related = ["repository", "prompt", "ki_provider"]
     search_fields = ["repository__name", "prompt__title"]
     ordering = ["-created_at"]
     readonly_fields = ["created_at"]
 
+    def get_changelist(self, request, **kwargs):
+        return PromptRunChangeList
+
 
 @admin.register(AppSettings)
 class AppSettingsAdmin(admin.ModelAdmin):
     list_display = ["default_ki_provider", "repo_download_root", "max_concat_bytes"]
+    list_select_related = ["default_ki_provider"]
 
     def has_add_permission(self, request):
         # Singleton: only one instance allowed
-        return not AppSettings.objects.exists()
+        return not AppSettings.exists()
 
     def has_delete_permission(self, request, obj=None):
         # Don't allow deletion of singleton
@@ -72,6 +92,7 @@ class AppSettingsAdmin(admin.ModelAdmin):
 class MarkdownCorpusAdmin(admin.ModelAdmin):
     list_display = ["repository", "file_size_bytes", "file_count", "is_complete", "created_at"]
     list_filter = ["is_complete", "created_at"]
+    list_select_related = ["repository"]
     search_fields = ["repository__name"]
     ordering = ["-created_at"]
     readonly_fields = ["created_at"]
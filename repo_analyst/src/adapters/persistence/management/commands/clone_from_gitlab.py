@@ -6,10 +6,18 @@ from pathlib import Path
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
 
 from adapters.git_platform.gitlab_mirror_adapter import GitLabMirrorAdapter
 from adapters.persistence.models import Repository
 
+# Repositories whose local path is written to the database per UPDATE batch
+UPDATE_BATCH_SIZE = 100
+
+# Repository fields read while mirroring
+MIRROR_FIELDS = ("id", "name", "namespace_path", "url")
+
 
 class Command(BaseCommand):
     help = "Clone or update repositories from GitLab"
@@ -47,6 +55,20 @@ class Command(BaseCommand):
             default=None,
             help="Target directory for cloning (default: REPO_DOWNLOAD_ROOT from settings)",
         )
+        parser.add_argument(
+            "--workers",
+            "--jobs",
+            dest="workers",
+            type=int,
+            required=False,
+            default=None,
+            help="Number of repositories to clone in parallel (default: 3/4 of the CPUs, at most 8)",
+        )
+        parser.add_argument(
+            "--full-history",
+            action="store_true",
+            help="Clone the full history with all blobs instead of a shallow, blob-less clone",
+        )
 
     def handle(self, *args, **options):
         gitlab_url = options["url"]
@@ -54,6 +76,8 @@ class Command(BaseCommand):
         ssl_verify = not options["no_ssl_verify"]
         repo_id = options["repo_id"]
         target_dir = options["target_dir"]
+        workers = options["workers"]
+        full_history = options["full_history"]
 
         # Use default target directory if not specified
         if not target_dir:
@@ -77,55 +101,54 @@ class Command(BaseCommand):
             mirror_adapter = GitLabMirrorAdapter(
                 private_token=token,
                 gitlab_url=gitlab_url,
-                ssl_verify=ssl_verify
+                ssl_verify=ssl_verify,
+                clone_depth=None if full_history else 1,
+                partial=not full_history
             )
 
-            # Get repositories to clone
+            # Get repositories to clone; only the fields used for mirroring are loaded
+            repository_fields = Repository.objects.only(*MIRROR_FIELDS)
             if repo_id:
-                repositories = [Repository.objects.get(pk=repo_id)]
+                repositories = [repository_fields.get(pk=repo_id)]
                 self.stdout.write(f"Cloning single repository (ID: {repo_id})")
             else:
-                repositories = Repository.objects.filter(is_active=True)
-                self.stdout.write(f"Cloning {repositories.count()} active repositories")
+                repositories = list(repository_fields.filter(is_active=True))
+                self.stdout.write(f"Cloning {len(repositories)} active repositories")
 
-            # Clone each repository
+            # Clone repositories in parallel; results are handled as clones finish
             success_count = 0
             error_count = 0
+            to_update = []
 
-            for repo in repositories:
-                try:
-                    self.stdout.write(f"\nProcessing: {repo.name} ({repo.namespace_path})")
-                    self.stdout.write(f"  URL: {repo.url}")
-
-                    # Clone or update repository
-                    local_path = mirror_adapter.mirror_repository(
-                        repo_name=repo.name,
-                        repo_url=repo.url,
-                        namespace_path=repo.namespace_path,
-                        target_dir=Path(target_dir)
-                    )
-
-                    # Update repository model with local path
-                    repo.local_path = str(local_path)
-                    repo.save()
+            results = mirror_adapter.iter_mirror_many(repositories, Path(target_dir), max_workers=workers)
 
-                    self.stdout.write(
-                        self.style.SUCCESS(f"  ✓ Successfully mirrored to: {local_path}")
-                    )
-                    success_count += 1
+            for repo, result in results:
+                self.stdout.write(f"\nProcessing: {repo.name} ({repo.namespace_path})")
+                self.stdout.write(f"  URL: {repo.url}")
 
-                except Repository.DoesNotExist:
+                if isinstance(result, Exception):
                     self.stdout.write(
-                        self.style.ERROR(f"  ✗ Repository with ID {repo_id} not found")
-                    )
-                    error_count += 1
-
-                except Exception as e:
-                    self.stdout.write(
-                        self.style.ERROR(f"  ✗ Failed to clone {repo.name}: {e}")
+                        self.style.ERROR(f"  ✗ Failed to clone {repo.name}: {result}")
                     )
                     error_count += 1
                     # Continue with next repository
+                    continue
+
+                # Update repository model with local path; written in batches.
+                # bulk_update skips auto_now, so updated_at is set explicitly
+                repo.local_path = str(result)
+                repo.updated_at = timezone.now()
+                to_update.append(repo)
+                if len(to_update) >= UPDATE_BATCH_SIZE:
+                    self._save_local_paths(to_update)
+                    to_update = []
+
+                self.stdout.write(
+                    self.style.SUCCESS(f"  ✓ Successfully mirrored to: {result}")
+                )
+                success_count += 1
+
+            self._save_local_paths(to_update)
 
             # Summary
             self.stdout.write("\n" + "=" * 60)
@@ -136,3 +159,10 @@ class Command(BaseCommand):
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Command failed: {e}"))
             raise
+
+    def _save_local_paths(self, repositories):
+        """Write local_path and updated_at of the given repositories in one transaction."""
+        if not repositories:
+            return
+        with transaction.atomic():
+            Repository.objects.bulk_update(repositories, ["local_path", "updated_at"], batch_size=UPDATE_BATCH_SIZE)
@@ -1,65 +1,124 @@
 """
 Management command to generate markdown corpus for a repository.
 """
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import connections
 
-from adapters.git_platform.markdown_builder import MarkdownCorpusBuilder
-from adapters.git_platform.mirror_adapter import LocalMirrorAdapter
+from adapters.persistence.management.corpus_worker import generate_corpus, init_worker
 from adapters.persistence.models import Repository
-from application.services import MarkdownCorpusService
 
 
 class Command(BaseCommand):
-    help = "Generate markdown corpus for a repository"
+    help = "Generate markdown corpus for one or more repositories"
 
     def add_arguments(self, parser):
-        parser.add_argument(
+        selection = parser.add_mutually_exclusive_group(required=True)
+        selection.add_argument(
             "--repo-id",
             type=int,
-            required=True,
             help="Repository ID",
         )
+        selection.add_argument(
+            "--repo-ids",
+            type=lambda value: [int(repo_id) for repo_id in value.split(",") if repo_id.strip()],
+            help="Comma-separated repository IDs",
+        )
+        selection.add_argument(
+            "--all-flagged",
+            action="store_true",
+            help="Generate corpora for all flagged repositories",
+        )
         parser.add_argument(
             "--max-bytes",
             type=int,
             default=None,
             help="Maximum size in bytes (default: from settings)",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of repositories processed in parallel (default: number of CPUs)",
+        )
 
     def handle(self, *args, **options):
-        repo_id = options["repo_id"]
         max_bytes = options["max_bytes"] or settings.MAX_CONCAT_BYTES
 
+        if options["repo_id"] is not None:
+            self._generate_one(options["repo_id"], max_bytes)
+            return
+
+        if options["all_flagged"]:
+            repo_ids = list(Repository.objects.filter(is_flagged=True).values_list("id", flat=True))
+        else:
+            repo_ids = options["repo_ids"]
+
+        if not repo_ids:
+            self.stdout.write(self.style.WARNING("No repositories selected"))
+            return
+
+        self._generate_many(repo_ids, max_bytes, options["workers"])
+
+    def _generate_one(self, repo_id, max_bytes):
+        """Generate the corpus of a single repository in this process."""
         try:
-            repo = Repository.objects.get(pk=repo_id)
-            self.stdout.write(f"Generating markdown corpus for repository: {repo.name}")
-
-            # Create adapters and service
-            markdown_builder = MarkdownCorpusBuilder()
-            mirror_adapter = LocalMirrorAdapter()
-            service = MarkdownCorpusService(markdown_builder, mirror_adapter)
-
-            # Generate corpus
-            corpus = service.generate_corpus(
-                repo_id,
-                settings.INCLUDE_PATTERNS,
-                settings.EXCLUDE_PATHS,
-                max_bytes
-            )
+            # Only the name is shown here; the service loads the repository itself
+            repo_name = Repository.objects.values_list("name", flat=True).get(pk=repo_id)
+            self.stdout.write(f"Generating markdown corpus for repository: {repo_name}")
 
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Successfully generated markdown corpus:\n"
-                    f"  Path: {corpus.file_path}\n"
-                    f"  Size: {corpus.file_size_bytes} bytes\n"
-                    f"  Files: {corpus.file_count}\n"
-                    f"  Complete: {corpus.is_complete}"
-                )
-            )
+            self._report(generate_corpus(repo_id, max_bytes))
 
         except Repository.DoesNotExist:
             self.stdout.write(self.style.ERROR(f"Repository with ID {repo_id} not found"))
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Markdown generation failed: {e}"))
             raise
+
+    def _generate_many(self, repo_ids, max_bytes, workers, mp_context=None):
+        """
+        Generate the corpora of several repositories in a process pool.
+
+        mp_context selects the multiprocessing start method (default: the platform's).
+        """
+        workers = max(1, min(workers, len(repo_ids)))
+        self.stdout.write(f"Generating markdown corpora for {len(repo_ids)} repositories with {workers} workers")
+
+        # Forked workers must not share the parent's database connections
+        connections.close_all()
+
+        success_count = 0
+        error_count = 0
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=init_worker) as executor:
+            futures = {executor.submit(generate_corpus, repo_id, max_bytes): repo_id for repo_id in repo_ids}
+
+            for future in as_completed(futures):
+                repo_id = futures[future]
+                self.stdout.write(f"\nRepository ID {repo_id}:")
+                try:
+                    self._report(future.result())
+                    success_count += 1
+                except Exception as e:
+                    self.stdout.write(self.style.ERROR(f"  Markdown generation failed: {e}"))
+                    error_count += 1
+
+        self.stdout.write("\n" + "=" * 60)
+        self.stdout.write(
+            self.style.SUCCESS(f"Corpus generation completed: {success_count} successful, {error_count} failed")
+        )
+
+    def _report(self, corpus):
+        """Write the summary of a generated corpus."""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully generated markdown corpus:\n"
+                f"  Path: {corpus['path']}\n"
+                f"  Size: {corpus['size']} bytes\n"
+                f"  Files: {corpus['files']}\n"
+                f"  Complete: {corpus['complete']}"
+            )
+        )
@@ -38,12 +38,19 @@ class Command(BaseCommand):
             default=100,
             help="Number of repositories to fetch per page (default: 100)",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="Number of pages to fetch from GitLab in parallel (default: 8)",
+        )
 
     def handle(self, *args, **options):
         gitlab_url = options["url"]
         token = options["token"]
         ssl_verify = not options["no_ssl_verify"]
         page_size = options["page_size"]
+        workers = options["workers"]
 
         # Validate token
         if not token:
@@ -62,7 +69,8 @@ class Command(BaseCommand):
             adapter = GitLabAdapter(
                 private_token=token,
                 gitlab_url=gitlab_url,
-                ssl_verify=ssl_verify
+                ssl_verify=ssl_verify,
+                max_workers=workers
             )
 
             # Create import service
@@ -70,10 +78,13 @@ class Command(BaseCommand):
 
             # Import repositories
             self.stdout.write("Fetching repositories from GitLab...")
-            count = service.import_repositories()
+            result = service.import_repositories(page_size=page_size)
 
             self.stdout.write(
-                self.style.SUCCESS(f"Successfully imported {count} repositories from GitLab")
+                self.style.SUCCESS(
+                    f"Successfully imported {result['total']} repositories from GitLab "
+                    f"({result['created']} created, {result['updated']} updated)"
+                )
             )
 
         except Exception as e:
@@ -1,6 +1,8 @@
 """
 Management command to import repositories from CSV/TSV file.
 """
+from pathlib import Path
+
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
@@ -18,24 +20,34 @@ class Command(BaseCommand):
             default=None,
             help="Path to CSV/TSV file (defaults to testdata/test_repositories.tsv)",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of repositories written to the database per batch (default: 1000)",
+        )
 
     def handle(self, *args, **options):
         csv_path = options["file"]
         if not csv_path:
             csv_path = settings.TESTDATA_CSV_PATH
+        batch_size = options["batch_size"]
 
         self.stdout.write(f"Importing repositories from: {csv_path}")
 
         try:
             # Create adapter and service
-            adapter = CSVMockAdapter(csv_path)
+            adapter = CSVMockAdapter(Path(csv_path))
             service = RepositoryImportService(adapter)
 
             # Import repositories
-            count = service.import_repositories()
+            result = service.import_repositories(page_size=batch_size)
 
             self.stdout.write(
-                self.style.SUCCESS(f"Successfully imported {count} repositories")
+                self.style.SUCCESS(
+                    f"Successfully imported {result['total']} repositories "
+                    f"({result['created']} created, {result['updated']} updated)"
+                )
             )
 
         except FileNotFoundError as e:
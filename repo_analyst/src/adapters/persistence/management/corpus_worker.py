@@ -0,0 +1,42 @@
+"""
+Process pool workers for markdown corpus generation.
+
+Spawned workers import this module before Django is set up, so models and
+services are imported inside the functions only.
+"""
+import django
+
+
+def init_worker():
+    """Set up Django in a pool worker; database connections are opened per worker."""
+    django.setup()
+
+
+def generate_corpus(repo_id, max_bytes):
+    """
+    Generate the markdown corpus of one repository.
+
+    Runs in the command's process or in a pool worker, so it returns plain data.
+
+    Returns:
+        Dictionary with path, size, file count and completeness of the corpus
+    """
+    from django.conf import settings
+
+    from adapters.git_platform.markdown_builder import MarkdownCorpusBuilder
+    from adapters.git_platform.mirror_adapter import LocalMirrorAdapter
+    from application.services import MarkdownCorpusService
+
+    service = MarkdownCorpusService(MarkdownCorpusBuilder(), LocalMirrorAdapter())
+    corpus = service.generate_corpus(
+        repo_id,
+        settings.INCLUDE_PATTERNS,
+        settings.EXCLUDE_PATHS,
+        max_bytes
+    )
+    return {
+        "path": corpus.file_path,
+        "size": corpus.file_size_bytes,
+        "files": corpus.file_count,
+        "complete": corpus.is_complete,
+    }
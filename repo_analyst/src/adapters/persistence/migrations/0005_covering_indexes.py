@@ -0,0 +1,29 @@
+# Generated manually for covering indexes on PromptRun and QualityAnalysis
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0004_promptrun_prompt_text_snapshot'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='promptrun',
+            name='persistence_reposit_10e471_idx',
+        ),
+        migrations.AddIndex(
+            model_name='promptrun',
+            index=models.Index(fields=['repository', 'prompt', '-created_at'], include=['score_pct'], name='pr_repo_prompt_ct_inc'),
+        ),
+        migrations.RemoveIndex(
+            model_name='qualityanalysis',
+            name='persistence_prompt__8c3e5d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='qualityanalysis',
+            index=models.Index(fields=['prompt_run', 'analysis_type'], include=['score_pct'], name='qa_run_type_inc'),
+        ),
+    ]
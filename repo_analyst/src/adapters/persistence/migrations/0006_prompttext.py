@@ -0,0 +1,66 @@
+# Generated manually for deduplicated prompt text snapshots
+
+import hashlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def store_prompt_texts(apps, schema_editor):
+    """Move the snapshot of every run into PromptText, one row per distinct text."""
+    PromptRun = apps.get_model('persistence', 'PromptRun')
+    PromptText = apps.get_model('persistence', 'PromptText')
+
+    runs = list(PromptRun.objects.only('id', 'prompt_text_snapshot'))
+    texts = {}
+    for run in runs:
+        run.content_hash = hashlib.sha256(run.prompt_text_snapshot.encode('utf-8')).hexdigest()
+        texts.setdefault(run.content_hash, run.prompt_text_snapshot)
+
+    PromptText.objects.bulk_create(
+        [PromptText(content_hash=content_hash, text=text) for content_hash, text in texts.items()],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+    text_ids = dict(PromptText.objects.values_list('content_hash', 'id'))
+    for run in runs:
+        run.prompt_text_id = text_ids[run.content_hash]
+    PromptRun.objects.bulk_update(runs, ['prompt_text'], batch_size=500)
+
+
+def restore_snapshots(apps, schema_editor):
+    """Copy the stored prompt texts back into the runs."""
+    PromptRun = apps.get_model('persistence', 'PromptRun')
+
+    runs = list(PromptRun.objects.select_related('prompt_text').only('id', 'prompt_text__text'))
+    for run in runs:
+        run.prompt_text_snapshot = run.prompt_text.text
+    PromptRun.objects.bulk_update(runs, ['prompt_text_snapshot'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0005_covering_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PromptText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(help_text='SHA-256 of the text', max_length=64, unique=True)),
+                ('text', models.TextField()),
+            ],
+            options={
+                'verbose_name': 'Prompt Text',
+                'verbose_name_plural': 'Prompt Texts',
+            },
+        ),
+        migrations.AddField(
+            model_name='promptrun',
+            name='prompt_text',
+            field=models.ForeignKey(help_text='Prompt text at execution time for auditability', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='runs', to='persistence.prompttext'),
+        ),
+        migrations.RunPython(store_prompt_texts, restore_snapshots),
+    ]
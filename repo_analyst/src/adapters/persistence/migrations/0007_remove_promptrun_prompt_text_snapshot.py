@@ -0,0 +1,30 @@
+# Generated manually for deduplicated prompt text snapshots
+# (separate from 0006 so the schema changes do not share a transaction with the data migration)
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0006_prompttext'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='promptrun',
+            name='prompt_text',
+            field=models.ForeignKey(help_text='Prompt text at execution time for auditability', on_delete=django.db.models.deletion.PROTECT, related_name='runs', to='persistence.prompttext'),
+        ),
+        # A default lets the column be re-added when this migration is reversed
+        migrations.AlterField(
+            model_name='promptrun',
+            name='prompt_text_snapshot',
+            field=models.TextField(default='', help_text='Snapshot of prompt text at execution time for auditability'),
+        ),
+        migrations.RemoveField(
+            model_name='promptrun',
+            name='prompt_text_snapshot',
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated manually for denormalized repository of quality analyses and service endpoints
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_repository(apps, schema_editor):
+    """Set repository from the prompt run with one UPDATE per table."""
+    PromptRun = apps.get_model('persistence', 'PromptRun')
+    run_repository = Subquery(
+        PromptRun.objects.filter(pk=OuterRef('prompt_run_id')).values('repository_id')[:1]
+    )
+    for model_name in ('QualityAnalysis', 'ServiceEndpoint'):
+        apps.get_model('persistence', model_name).objects.update(repository_id=run_repository)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0007_remove_promptrun_prompt_text_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='qualityanalysis',
+            name='repository',
+            field=models.ForeignKey(editable=False, help_text='Repository of the prompt run, stored for direct filtering', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='quality_analyses', to='persistence.repository'),
+        ),
+        migrations.AddField(
+            model_name='serviceendpoint',
+            name='repository',
+            field=models.ForeignKey(editable=False, help_text='Repository of the prompt run, stored for direct filtering', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='service_endpoints', to='persistence.repository'),
+        ),
+        migrations.RunPython(copy_repository, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated manually for denormalized repository of quality analyses and service endpoints
+# (separate from 0008 so the schema changes do not share a transaction with the data migration)
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0008_denormalize_analysis_repository'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='qualityanalysis',
+            name='repository',
+            field=models.ForeignKey(editable=False, help_text='Repository of the prompt run, stored for direct filtering', on_delete=django.db.models.deletion.CASCADE, related_name='quality_analyses', to='persistence.repository'),
+        ),
+        migrations.AlterField(
+            model_name='serviceendpoint',
+            name='repository',
+            field=models.ForeignKey(editable=False, help_text='Repository of the prompt run, stored for direct filtering', on_delete=django.db.models.deletion.CASCADE, related_name='service_endpoints', to='persistence.repository'),
+        ),
+        migrations.AddIndex(
+            model_name='qualityanalysis',
+            index=models.Index(fields=['repository', 'analysis_type', '-created_at'], name='qa_repo_type_ct_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='serviceendpoint',
+            index=models.Index(fields=['repository', 'endpoint_type'], name='se_repo_type_idx'),
+        ),
+    ]
@@ -2,9 +2,18 @@
 Django ORM models for Repo-Analyst application.
 These are the persistence adapters for domain entities.
 """
+import hashlib
+
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 
+# Cache key and lifetime of the AppSettings existence flag
+APP_SETTINGS_EXISTS_CACHE_KEY = "appsettings:exists"
+APP_SETTINGS_EXISTS_TTL_S = 60
+
 
 class ART(models.Model):
     """Agile Release Train"""
@@ -118,12 +127,37 @@ class KIProvider(models.Model):
         return f"{self.name} ({self.model_name})"
 
 
+class PromptText(models.Model):
+    """Immutable prompt text, stored once per distinct content"""
+    content_hash = models.CharField(max_length=64, unique=True, help_text="SHA-256 of the text")
+    text = models.TextField()
+
+    class Meta:
+        verbose_name = "Prompt Text"
+        verbose_name_plural = "Prompt Texts"
+
+    def __str__(self):
+        return self.content_hash[:12]
+
+    @classmethod
+    def for_text(cls, text):
+        """Load or create the stored prompt text with this content"""
+        obj, created = cls.objects.get_or_create(
+            content_hash=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            defaults={"text": text}
+        )
+        return obj
+
+
 class PromptRun(models.Model):
     """Result of running a prompt against a repository"""
     repository = models.ForeignKey(Repository, on_delete=models.CASCADE, related_name="prompt_runs")
     prompt = models.ForeignKey(Prompt, on_delete=models.CASCADE, related_name="runs")
-    prompt_text_snapshot = models.TextField(
-        help_text="Snapshot of prompt text at execution time for auditability"
+    prompt_text = models.ForeignKey(
+        PromptText,
+        on_delete=models.PROTECT,
+        related_name="runs",
+        help_text="Prompt text at execution time for auditability"
     )
     ki_provider = models.ForeignKey(KIProvider, on_delete=models.CASCADE, related_name="runs")
     request_text = models.TextField()
@@ -137,7 +171,13 @@ class PromptRun(models.Model):
     class Meta:
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["repository", "prompt", "-created_at"]),
+            # Covers the score of the latest runs; summary is unbounded text and
+            # would exceed the B-tree row size limit
+            models.Index(
+                fields=["repository", "prompt", "-created_at"],
+                include=["score_pct"],
+                name="pr_repo_prompt_ct_inc",
+            ),
         ]
 
     def __str__(self):
@@ -178,6 +218,21 @@ class AppSettings(models.Model):
         obj, created = cls.objects.get_or_create(pk=1)
         return obj
 
+    @classmethod
+    def exists(cls):
+        """Whether the settings singleton exists; cached, since it almost always does"""
+        exists = cache.get(APP_SETTINGS_EXISTS_CACHE_KEY)
+        if exists is None:
+            exists = cls.objects.exists()
+            cache.set(APP_SETTINGS_EXISTS_CACHE_KEY, exists, APP_SETTINGS_EXISTS_TTL_S)
+        return exists
+
+
+@receiver(post_save, sender=AppSettings)
+@receiver(post_delete, sender=AppSettings)
+def _invalidate_app_settings_exists(sender, **kwargs):
+    cache.delete(APP_SETTINGS_EXISTS_CACHE_KEY)
+
 
 class MarkdownCorpus(models.Model):
     """Generated markdown corpus for a repository"""
@@ -217,6 +272,13 @@ class ServiceEndpoint(models.Model):
     ]
 
     prompt_run = models.ForeignKey(PromptRun, on_delete=models.CASCADE, related_name="service_endpoints")
+    repository = models.ForeignKey(
+        Repository,
+        on_delete=models.CASCADE,
+        related_name="service_endpoints",
+        editable=False,
+        help_text="Repository of the prompt run, stored for direct filtering"
+    )
     endpoint_type = models.CharField(max_length=10, choices=ENDPOINT_TYPE_CHOICES)
     url = models.CharField(max_length=1000, help_text="URL path or WSDL URL")
     http_method = models.CharField(max_length=10, choices=HTTP_METHOD_CHOICES, blank=True, null=True, help_text="HTTP method (REST only)")
@@ -236,6 +298,7 @@ class ServiceEndpoint(models.Model):
         indexes = [
             models.Index(fields=["prompt_run", "endpoint_type"]),
             models.Index(fields=["endpoint_type", "-created_at"]),
+            models.Index(fields=["repository", "endpoint_type"], name="se_repo_type_idx"),
         ]
 
     def __str__(self):
@@ -244,10 +307,10 @@ class ServiceEndpoint(models.Model):
         else:
             return f"{self.operation_name or self.url}"
 
-    @property
-    def repository(self):
-        """Helper to get repository from prompt_run"""
-        return self.prompt_run.repository
+    def save(self, *args, **kwargs):
+        # Denormalized from prompt_run
+        self.repository_id = self.prompt_run.repository_id
+        super().save(*args, **kwargs)
 
 
 class QualityAnalysis(models.Model):
@@ -269,6 +332,13 @@ class QualityAnalysis(models.Model):
     ]
 
     prompt_run = models.ForeignKey(PromptRun, on_delete=models.CASCADE, related_name="quality_analyses")
+    repository = models.ForeignKey(
+        Repository,
+        on_delete=models.CASCADE,
+        related_name="quality_analyses",
+        editable=False,
+        help_text="Repository of the prompt run, stored for direct filtering"
+    )
     analysis_type = models.CharField(max_length=20, choices=ANALYSIS_TYPE_CHOICES)
     score_pct = models.IntegerField(help_text="Overall score 0-100")
     assessment_text = models.TextField(help_text="Detailed assessment description")
@@ -290,15 +360,16 @@ class QualityAnalysis(models.Model):
         verbose_name_plural = "Quality Analyses"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["prompt_run", "analysis_type"]),
+            models.Index(fields=["prompt_run", "analysis_type"], include=["score_pct"], name="qa_run_type_inc"),
             models.Index(fields=["analysis_type", "-created_at"]),
             models.Index(fields=["score_pct"]),
+            models.Index(fields=["repository", "analysis_type", "-created_at"], name="qa_repo_type_ct_idx"),
         ]
 
     def __str__(self):
-        return f"{self.get_analysis_type_display()} - {self.prompt_run.repository.name} ({self.score_pct}%)"
+        return f"{self.get_analysis_type_display()} - {self.repository.name} ({self.score_pct}%)"
 
-    @property
-    def repository(self):
-        """Helper to get repository from prompt_run"""
-        return self.prompt_run.repository
+    def save(self, *args, **kwargs):
+        # Denormalized from prompt_run
+        self.repository_id = self.prompt_run.repository_id
+        super().save(*args, **kwargs)
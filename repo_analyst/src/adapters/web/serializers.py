@@ -94,6 +94,7 @@ class PromptRunSerializer(serializers.ModelSerializer):
     repository_name = serializers.CharField(source="repository.name", read_only=True)
     prompt_title = serializers.CharField(source="prompt.title", read_only=True)
     ki_provider_name = serializers.CharField(source="ki_provider.name", read_only=True)
+    prompt_text_snapshot = serializers.CharField(source="prompt_text.text", read_only=True)
 
     class Meta:
         model = PromptRun
@@ -139,8 +140,8 @@ class MarkdownCorpusSerializer(serializers.ModelSerializer):
 
 
 class ServiceEndpointSerializer(serializers.ModelSerializer):
-    repository_name = serializers.CharField(source="prompt_run.repository.name", read_only=True)
-    application_name = serializers.CharField(source="prompt_run.repository.application.name", read_only=True)
+    repository_name = serializers.CharField(source="repository.name", read_only=True)
+    application_name = serializers.CharField(source="repository.application.name", read_only=True)
     endpoint_type_display = serializers.CharField(source="get_endpoint_type_display", read_only=True)
 
     class Meta:
@@ -155,8 +156,8 @@ class ServiceEndpointSerializer(serializers.ModelSerializer):
 
 
 class QualityAnalysisSerializer(serializers.ModelSerializer):
-    repository_name = serializers.CharField(source="prompt_run.repository.name", read_only=True)
-    application_name = serializers.CharField(source="prompt_run.repository.application.name", read_only=True)
+    repository_name = serializers.CharField(source="repository.name", read_only=True)
+    application_name = serializers.CharField(source="repository.application.name", read_only=True)
     analysis_type_display = serializers.CharField(source="get_analysis_type_display", read_only=True)
 
     class Meta:
@@ -540,7 +540,7 @@ class QualityAnalysisListView(ListView):
         from django.db.models import Q
 
         queryset = QualityAnalysis.objects.select_related(
-            "prompt_run__repository__application",
+            "repository__application",
             "prompt_run__prompt"
         )
 
@@ -549,7 +549,7 @@ class QualityAnalysisListView(ListView):
         if search:
             queryset = queryset.filter(
                 Q(assessment_text__icontains=search) |
-                Q(prompt_run__repository__name__icontains=search)
+                Q(repository__name__icontains=search)
             )
 
         # Filter by analysis type
@@ -560,7 +560,7 @@ class QualityAnalysisListView(ListView):
         # Filter by repository
         repository_id = self.request.GET.get("repository")
         if repository_id:
-            queryset = queryset.filter(prompt_run__repository_id=repository_id)
+            queryset = queryset.filter(repository_id=repository_id)
 
         # Filter by score range
         min_score = self.request.GET.get("min_score")
@@ -599,7 +599,8 @@ class ServiceEndpointListView(ListView):
         from django.db.models import Q
 
         queryset = ServiceEndpoint.objects.select_related(
-            "prompt_run__repository__application"
+            "repository__application",
+            "prompt_run"
         )
 
         # Search by text
@@ -609,7 +610,7 @@ class ServiceEndpointListView(ListView):
                 Q(url__icontains=search) |
                 Q(operation_name__icontains=search) |
                 Q(description__icontains=search) |
-                Q(prompt_run__repository__name__icontains=search)
+                Q(repository__name__icontains=search)
             )
 
         # Filter by endpoint type
@@ -620,7 +621,7 @@ class ServiceEndpointListView(ListView):
         # Filter by repository
         repository_id = self.request.GET.get("repository")
         if repository_id:
-            queryset = queryset.filter(prompt_run__repository_id=repository_id)
+            queryset = queryset.filter(repository_id=repository_id)
 
         # Filter by maturity score
         min_score = self.request.GET.get("min_score")
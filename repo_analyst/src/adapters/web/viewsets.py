@@ -162,7 +162,7 @@ class KIProviderViewSet(viewsets.ModelViewSet):
 
 class PromptRunViewSet(viewsets.ModelViewSet):
     """ViewSet for PromptRun management."""
-    queryset = PromptRun.objects.all()
+    queryset = PromptRun.objects.select_related("repository", "prompt", "ki_provider", "prompt_text")
     serializer_class = PromptRunSerializer
     filterset_fields = ["repository", "prompt", "ki_provider"]
     search_fields = ["repository__name", "prompt__title"]
@@ -353,10 +353,10 @@ class BackupViewSet(viewsets.ViewSet):
 class ServiceEndpointViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for Service Endpoints (read-only)."""
     queryset = ServiceEndpoint.objects.select_related(
-        "prompt_run__repository__application"
+        "repository__application"
     ).all()
     serializer_class = ServiceEndpointSerializer
-    filterset_fields = ["endpoint_type", "prompt_run__repository"]
+    filterset_fields = ["endpoint_type", "repository", "prompt_run__repository"]
     search_fields = ["url", "operation_name", "description"]
     ordering_fields = ["created_at", "endpoint_type", "maturity_score_pct"]
 
@@ -364,9 +364,9 @@ class ServiceEndpointViewSet(viewsets.ReadOnlyModelViewSet):
 class QualityAnalysisViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for Quality Analyses (read-only)."""
     queryset = QualityAnalysis.objects.select_related(
-        "prompt_run__repository__application"
+        "repository__application"
     ).all()
     serializer_class = QualityAnalysisSerializer
-    filterset_fields = ["analysis_type", "prompt_run__repository"]
+    filterset_fields = ["analysis_type", "repository", "prompt_run__repository"]
     search_fields = ["assessment_text"]
     ordering_fields = ["created_at", "score_pct", "analysis_type"]
@@ -19,6 +19,7 @@ from adapters.persistence.models import (
     MarkdownCorpus,
     Prompt,
     PromptRun,
+    PromptText,
     Repository,
 )
 
@@ -35,6 +36,7 @@ class BackupService:
         Repository,
         Prompt,
         KIProvider,
+        PromptText,
         PromptRun,
         AppSettings,
         MarkdownCorpus,
@@ -160,6 +162,9 @@ class BackupService:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     data = f.read()
 
+                if model is PromptRun:
+                    data = self._upgrade_prompt_runs(data)
+
                 objects = serializers.deserialize('json', data)
 
                 # Save all objects
@@ -178,6 +183,31 @@ class BackupService:
             logger.error(f"Restore failed: {e}", exc_info=True)
             raise
 
+    def _upgrade_prompt_runs(self, data: str) -> str:
+        """
+        Convert prompt runs from backups made before prompt texts were deduplicated.
+
+        Such backups carry the full text in prompt_text_snapshot and have no
+        prompttext.json; the text is stored as PromptText and referenced instead.
+
+        Args:
+            data: Serialized PromptRun records
+
+        Returns:
+            Serialized records in the current format
+        """
+        records = json.loads(data)
+        legacy = [r for r in records if "prompt_text_snapshot" in r["fields"]]
+        if not legacy:
+            return data
+
+        logger.info(f"Converting {len(legacy)} prompt runs from legacy backup format")
+        for record in legacy:
+            fields = record["fields"]
+            fields["prompt_text"] = PromptText.for_text(fields.pop("prompt_text_snapshot")).pk
+
+        return json.dumps(records)
+
     def list_backups(self) -> List[Dict]:
         """
         List all available backups.
@@ -4,7 +4,7 @@ These orchestrate domain logic and coordinate with adapters.
 """
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from django.db import transaction
 
@@ -13,12 +13,18 @@ from adapters.persistence.models import KIProvider as KIProviderModel
 from adapters.persistence.models import MarkdownCorpus as MarkdownCorpusModel
 from adapters.persistence.models import Prompt as PromptModel
 from adapters.persistence.models import PromptRun as PromptRunModel
+from adapters.persistence.models import PromptText as PromptTextModel
 from adapters.persistence.models import Repository as RepositoryModel
 from domain.entities import RepositoryDTO
 from domain.ports import GitPlatformPort, KIClientPort, MarkdownCorpusPort, RepositoryMirrorPort
 
 logger = logging.getLogger(__name__)
 
+# Repository fields overwritten when an imported repository already exists
+UPSERT_FIELDS = [
+    "name", "url", "description", "tech_stack", "namespace_path", "visibility", "is_active", "updated_at",
+]
+
 
 class RepositoryImportService:
     """Service for importing repositories from Git platforms."""
@@ -30,6 +36,9 @@ class RepositoryImportService:
         """
         Import all repositories from configured Git platform with pagination.
 
+        Pages come from the platform adapter, which may fetch them concurrently;
+        each page is written to the database from this thread only.
+
         Args:
             page_size: Number of repositories to fetch per page
 
@@ -40,53 +49,18 @@ class RepositoryImportService:
         total_count = 0
         created_count = 0
         updated_count = 0
-        page = 1
-
-        while True:
-            logger.info(f"Fetching page {page} (page_size={page_size})")
-            repos = self.git_platform.list_repositories(
-                page_size=page_size,
-                page_token=str(page)
-            )
-
-            if not repos:
-                logger.info(f"No more repositories found on page {page}. Import complete.")
-                break
 
+        pages = self.git_platform.iter_repository_pages(page_size=page_size)
+        for page, repos in enumerate(pages, start=1):
             logger.info(f"Processing {len(repos)} repositories from page {page}")
 
-            with transaction.atomic():
-                for repo_dto in repos:
-                    repo, created = RepositoryModel.objects.update_or_create(
-                        external_id=repo_dto.external_id,
-                        defaults={
-                            "name": repo_dto.name,
-                            "url": repo_dto.url,
-                            "description": repo_dto.description,
-                            "tech_stack": repo_dto.tech_stack,
-                            "namespace_path": repo_dto.namespace_path,
-                            "visibility": repo_dto.visibility,
-                            "is_active": repo_dto.is_active,
-                        },
-                    )
-                    action = "created" if created else "updated"
-                    logger.debug(f"Repository {repo.name} {action}")
-                    total_count += 1
-                    if created:
-                        created_count += 1
-                    else:
-                        updated_count += 1
+            created, updated = self._upsert_page(repos, page_size)
+            total_count += created + updated
+            created_count += created
+            updated_count += updated
 
             logger.info(f"Page {page} completed: {len(repos)} repositories processed")
 
-            # Break if we got fewer repositories than the page size
-            # This indicates we've reached the last page
-            if len(repos) < page_size:
-                logger.info(f"Last page reached (got {len(repos)} < {page_size})")
-                break
-
-            page += 1
-
         result = {
             "total": total_count,
             "created": created_count,
@@ -95,6 +69,47 @@ class RepositoryImportService:
         logger.info(f"Repository import completed: {result}")
         return result
 
+    @staticmethod
+    def _upsert_page(repos: List[RepositoryDTO], batch_size: int) -> Tuple[int, int]:
+        """
+        Insert or update the repositories of one page with a single bulk upsert.
+
+        Args:
+            repos: Repositories of the page
+            batch_size: Rows per INSERT statement
+
+        Returns:
+            Tuple of (created, updated) counts
+        """
+        # One row per external_id; a row can be affected only once per upsert
+        repositories = {
+            repo_dto.external_id: RepositoryModel(
+                external_id=repo_dto.external_id,
+                name=repo_dto.name,
+                url=repo_dto.url,
+                description=repo_dto.description,
+                tech_stack=repo_dto.tech_stack,
+                namespace_path=repo_dto.namespace_path,
+                visibility=repo_dto.visibility,
+                is_active=repo_dto.is_active,
+            )
+            for repo_dto in repos
+        }
+
+        with transaction.atomic():
+            existing = set(
+                RepositoryModel.objects.filter(external_id__in=repositories).values_list("external_id", flat=True)
+            )
+            RepositoryModel.objects.bulk_create(
+                repositories.values(),
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["external_id"],
+                update_fields=UPSERT_FIELDS,
+            )
+
+        return len(repositories) - len(existing), len(existing)
+
 
 class RepositoryAssignmentService:
     """Service for assigning repositories to applications and ARTs."""
@@ -270,7 +285,7 @@ class PromptExecutionService:
             prompt_run = PromptRunModel.objects.create(
                 repository=repo,
                 prompt=prompt,
-                prompt_text_snapshot=prompt.prompt_text,  # Save snapshot for auditability
+                prompt_text=PromptTextModel.for_text(prompt.prompt_text),  # Save snapshot for auditability
                 ki_provider=ki_provider,
                 request_text=request_text,
                 response_json=response,
@@ -22,6 +22,8 @@ env = environ.Env(
     INCLUDE_PATTERNS=(str, "*.py,*.md,*.txt,*.js,*.ts,*.tsx,*.jsx,*.java,*.kt,*.go,*.yml,*.yaml,*.json"),
     EXCLUDE_PATHS=(str, ".git,node_modules,dist,build,target,venv,.venv,__pycache__"),
     MAX_CONCAT_BYTES=(int, 460800),
+    # Seconds a database connection is kept open for reuse (0: close after each request)
+    DB_CONN_MAX_AGE=(int, 600),
     # Source code repository adapter configuration
     REPOSITORY_ADAPTER=(str, "mock"),
     GITLAB_URL=(str, ""),
@@ -97,6 +99,13 @@ DATABASES = {
     "default": env.db("DATABASE_URL", default="sqlite:///db.sqlite3")
 }
 
+# Reuse server connections across requests instead of opening a new backend
+# process for each one; health checks drop connections the server has closed.
+# SQLite connections are cheap to open and keep Django's default.
+if DATABASES["default"]["ENGINE"] != "django.db.backends.sqlite3":
+    DATABASES["default"]["CONN_MAX_AGE"] = env("DB_CONN_MAX_AGE")
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
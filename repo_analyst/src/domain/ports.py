@@ -4,7 +4,7 @@ These define the contracts that adapters must implement.
 """
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from domain.entities import RepositoryDTO
 
@@ -26,6 +26,28 @@ class GitPlatformPort(ABC):
         """
         pass
 
+    def iter_repository_pages(self, page_size: int = 100) -> Iterator[List[RepositoryDTO]]:
+        """
+        Yield all repositories page by page.
+
+        Requests one page after another until a page comes back short; platforms
+        that can fetch pages concurrently override this.
+
+        Args:
+            page_size: Number of repositories per page
+
+        Yields:
+            Non-empty lists of RepositoryDTO objects
+        """
+        page = 1
+        while True:
+            repos = self.list_repositories(page_size=page_size, page_token=str(page))
+            if repos:
+                yield repos
+            if len(repos) < page_size:
+                return
+            page += 1
+
 
 class KIClientPort(ABC):
     """Port for KI/AI client integration"""
@@ -44,6 +66,35 @@ class KIClientPort(ABC):
         """
         pass
 
+    def analyze_many(self, items: List[Tuple[str, str]]) -> List[dict]:
+        """
+        Send several analysis requests.
+
+        Runs them one after another; clients that can overlap requests override this.
+
+        Args:
+            items: (prompt_text, context) pairs
+
+        Returns:
+            Analysis results in the order of items
+        """
+        return [self.analyze(prompt_text, context) for prompt_text, context in items]
+
+    def analyze_bundle(self, prompts: List[str], context: str = "") -> List[dict]:
+        """
+        Answer several prompts on the same context.
+
+        Sends one request per prompt; clients that can combine prompts override this.
+
+        Args:
+            prompts: Prompts to answer
+            context: Context shared by all prompts
+
+        Returns:
+            Analysis results in the order of prompts
+        """
+        return [self.analyze(prompt_text, context) for prompt_text in prompts]
+
 
 class MarkdownCorpusPort(ABC):
     """Port for generating markdown corpus from repository"""
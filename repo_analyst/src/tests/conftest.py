@@ -7,6 +7,7 @@ from pathlib import Path
 # Configure Django
 import os
 import sys
+import threading
 
 # Add src to path
 src_path = Path(__file__).resolve().parent.parent
@@ -47,3 +48,91 @@ test-repo\tTest Repository\t2024-01-01T10:00:00+01:00\t2024-01-02T10:00:00+01:00
     csv_path = tmp_path / "test_repos.tsv"
     csv_path.write_text(csv_content)
     return csv_path
+
+
+class _StubProject:
+    """GitLab project as returned by python-gitlab (raw fields in .attributes)."""
+
+    def __init__(self, project_id):
+        self.id = project_id
+        self.attributes = {
+            "id": project_id,
+            "name": f"repo-{project_id}",
+            "web_url": f"https://git.example.com/group/repo-{project_id}",
+            "path_with_namespace": f"group/repo-{project_id}",
+            "visibility": "private",
+            "archived": False,
+            "created_at": "2024-01-01T10:00:00+01:00",
+            "last_activity_at": "2024-01-02T10:00:00+01:00",
+        }
+
+
+class _StubGitlabList:
+    """Lazy project listing shaped like python-gitlab's GitlabList."""
+
+    def __init__(self, projects, page_size, report_total_pages):
+        self._projects = projects
+        # GitlabList requests the first page when it is created
+        self._pages = [projects.load_page(1, page_size)]
+        self._page_size = page_size
+        self._items = iter(self._pages[0])
+        self.total_pages = projects.total_pages(page_size) if report_total_pages else None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._items)
+        except StopIteration:
+            # Like GitlabList, the next page is requested once the current one is used up
+            page = self._projects.load_page(len(self._pages) + 1, self._page_size)
+            if not page:
+                raise
+            self._pages.append(page)
+            self._items = iter(page)
+            return next(self._items)
+
+
+class _StubProjectManager:
+    """
+    Stand-in for gl.projects with python-gitlab's list() return types.
+
+    With page= a plain list of that page is returned (iterator=True is ignored),
+    with iterator=True alone a lazy _StubGitlabList.
+    """
+
+    def __init__(self, project_count, report_total_pages=True):
+        self.project_count = project_count
+        self.report_total_pages = report_total_pages
+        self.requested_pages = []
+        self._lock = threading.Lock()
+
+    def total_pages(self, page_size):
+        return max(1, -(-self.project_count // page_size))
+
+    def load_page(self, page, page_size):
+        with self._lock:
+            self.requested_pages.append(page)
+        first = (page - 1) * page_size + 1
+        return [_StubProject(i) for i in range(first, min(first + page_size, self.project_count + 1))]
+
+    def list(self, page=None, per_page=20, iterator=False, **filters):
+        if page is not None:
+            return self.load_page(page, per_page)
+        if iterator:
+            return _StubGitlabList(self, per_page, self.report_total_pages)
+        return self.load_page(1, per_page)
+
+
+@pytest.fixture
+def stub_gitlab_adapter():
+    """Factory for a GitLabAdapter whose gl.projects serves stubbed projects without HTTP."""
+    from adapters.git_platform.gitlab_adapter import GitLabAdapter
+
+    def create(project_count, report_total_pages=True, max_workers=4):
+        adapter = GitLabAdapter("token", "https://git.example.com", max_workers=max_workers)
+        adapter.gl.projects = _StubProjectManager(project_count, report_total_pages)
+        return adapter
+
+    return create
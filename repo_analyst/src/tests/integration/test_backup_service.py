@@ -0,0 +1,64 @@
+"""
+Integration tests for backup and restore service.
+"""
+import json
+
+import pytest
+from adapters.persistence.models import KIProvider, Prompt, PromptRun, PromptText, Repository
+from application.backup_service import BackupService
+
+
+def _create_prompt_run():
+    repository = Repository.objects.create(
+        name="test-repo", external_id="1234", url="https://git.example.com/test-repo"
+    )
+    prompt = Prompt.objects.create(title="Security", short_description="Check security", prompt_text="Analyse")
+    provider = KIProvider.objects.create(
+        name="provider", base_url="https://ki.example.com", model_name="model", auth_token_env_var="KI_TOKEN"
+    )
+    return PromptRun.objects.create(
+        repository=repository,
+        prompt=prompt,
+        prompt_text=PromptText.for_text("Analyse the repository"),
+        ki_provider=provider,
+        request_text="request",
+        response_json={"score": 80},
+    )
+
+
+@pytest.mark.django_db
+def test_backup_restore_round_trip_keeps_prompt_texts(tmp_path):
+    """Test that prompt runs and their prompt texts survive a backup and restore."""
+    run = _create_prompt_run()
+    service = BackupService(tmp_path)
+    backup_dir = service.create_backup("round-trip")
+
+    PromptRun.objects.all().delete()
+    PromptText.objects.all().delete()
+    counts = service.restore_backup(backup_dir.name)
+
+    assert counts["prompttext"] == 1
+    assert counts["promptrun"] == 1
+    assert PromptRun.objects.get(pk=run.pk).prompt_text.text == "Analyse the repository"
+
+
+@pytest.mark.django_db
+def test_restore_converts_legacy_prompt_text_snapshots(tmp_path):
+    """Test that backups with inline prompt_text_snapshot are restored into PromptText rows."""
+    run = _create_prompt_run()
+    service = BackupService(tmp_path)
+    backup_dir = service.create_backup("legacy")
+
+    # Rewrite the backup into the format used before prompt texts were deduplicated
+    (backup_dir / "prompttext.json").unlink()
+    runs_path = backup_dir / "promptrun.json"
+    records = json.loads(runs_path.read_text(encoding="utf-8"))
+    for record in records:
+        record["fields"].pop("prompt_text")
+        record["fields"]["prompt_text_snapshot"] = "Analyse the repository"
+    runs_path.write_text(json.dumps(records), encoding="utf-8")
+
+    service.restore_backup(backup_dir.name)
+
+    assert PromptText.objects.count() == 1
+    assert PromptRun.objects.get(pk=run.pk).prompt_text.text == "Analyse the repository"
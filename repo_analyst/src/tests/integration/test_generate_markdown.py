@@ -0,0 +1,20 @@
+"""
+Integration tests for the generate_markdown management command.
+"""
+import io
+from multiprocessing import get_context
+
+from adapters.persistence.management.commands.generate_markdown import Command
+
+
+def test_generate_many_runs_workers_under_spawn():
+    """Test that spawned pool workers set up Django and report per-repository results."""
+    stdout = io.StringIO()
+
+    # The repository does not exist, so the worker itself reports a failure
+    Command(stdout=stdout)._generate_many([999999], 1000, 1, mp_context=get_context("spawn"))
+
+    output = stdout.getvalue()
+    assert "terminated abruptly" not in output
+    assert "Markdown generation failed" in output
+    assert "0 successful, 1 failed" in output
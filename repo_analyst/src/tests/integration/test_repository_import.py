@@ -38,3 +38,15 @@ class TestRepositoryImport(TestCase):
 
         # Should still have only one repository
         assert RepositoryModel.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_import_from_gitlab_adapter_stores_all_pages(stub_gitlab_adapter):
+    """Test that the import service stores every page listed by the GitLab adapter."""
+    service = RepositoryImportService(stub_gitlab_adapter(project_count=25, max_workers=2))
+
+    result = service.import_repositories(page_size=10)
+
+    assert result == {"total": 25, "created": 25, "updated": 0}
+    assert RepositoryModel.objects.count() == 25
+    assert RepositoryModel.objects.get(external_id="25").visibility == "private"
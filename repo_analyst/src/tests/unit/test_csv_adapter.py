@@ -1,6 +1,8 @@
 """
 Unit tests for CSV adapter.
 """
+import os
+
 import pytest
 from pathlib import Path
 
@@ -34,3 +36,58 @@ def test_csv_adapter_parses_dates(temp_csv_file):
 
     assert repos[0].created_at is not None
     assert repos[0].updated_at is not None
+
+
+def test_csv_adapter_defaults_missing_optional_columns(tmp_path):
+    """Test that optional columns fall back to their defaults when absent."""
+    csv_path = tmp_path / "minimal.tsv"
+    csv_path.write_text(
+        "name\tweb_url\texternal_id\n"
+        "minimal-repo\thttps://git.example.com/minimal-repo\t42\n"
+    )
+    adapter = CSVMockAdapter(csv_path)
+    repos = adapter.list_repositories()
+
+    assert len(repos) == 1
+    assert repos[0].visibility == "internal"
+    assert repos[0].is_active is True
+    assert repos[0].created_at is None
+
+
+def test_csv_adapter_missing_required_column(tmp_path):
+    """Test that a file without a required column is rejected."""
+    csv_path = tmp_path / "broken.tsv"
+    csv_path.write_text("name\tweb_url\nbroken-repo\thttps://git.example.com/broken-repo\n")
+    adapter = CSVMockAdapter(csv_path)
+
+    with pytest.raises(ValueError):
+        adapter.list_repositories()
+
+
+def test_csv_adapter_rereads_changed_file(temp_csv_file):
+    """Test that the parsed file is cached per instance and refreshed on change."""
+    adapter = CSVMockAdapter(temp_csv_file)
+    assert len(adapter.list_repositories()) == 1
+
+    with open(temp_csv_file, "a") as f:
+        f.write("second-repo\t\t\t\tinternal\t1\thttps://git.example.com/second-repo\ttest-org\t5678\n")
+    stat = temp_csv_file.stat()
+    os.utime(temp_csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    repos = adapter.list_repositories()
+    assert [repo.external_id for repo in repos] == ["1234", "5678"]
+    assert adapter.list_repositories(page_size=1, page_token="2")[0].name == "second-repo"
+
+
+def test_csv_adapter_streams_pages_of_comma_separated_file(tmp_path):
+    """Test that pages are streamed in order and a comma delimiter is detected."""
+    csv_path = tmp_path / "repos.csv"
+    rows = [f"repo-{i},https://git.example.com/repo-{i},{i}" for i in range(5)]
+    csv_path.write_text("name,web_url,external_id\n" + "\n".join(rows) + "\n")
+    adapter = CSVMockAdapter(csv_path)
+
+    pages = list(adapter.iter_repository_pages(page_size=2))
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [repo.external_id for page in pages for repo in page] == ["0", "1", "2", "3", "4"]
+    assert pages[0][0].url == "https://git.example.com/repo-0"
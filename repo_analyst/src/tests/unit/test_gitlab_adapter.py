@@ -0,0 +1,70 @@
+"""
+Unit tests for GitLab adapter paging.
+"""
+import threading
+from types import SimpleNamespace
+
+from adapters.git_platform.gitlab_adapter import GitLabAdapter
+
+
+class _RecordingProjects:
+    """Stand-in for gl.projects that records which pages were requested."""
+
+    def __init__(self):
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def list(self, page, per_page, **filters):
+        with self._lock:
+            self.requested.append(page)
+        return [page]
+
+
+def _adapter(projects):
+    adapter = GitLabAdapter.__new__(GitLabAdapter)
+    adapter.gl = SimpleNamespace(projects=projects)
+    return adapter
+
+
+def test_fetch_pages_yields_pages_in_order():
+    """Test that concurrently fetched pages are yielded in page order."""
+    projects = _RecordingProjects()
+
+    pages = list(_adapter(projects)._fetch_pages(range(2, 20), page_size=10, max_workers=4))
+
+    assert pages == [[page] for page in range(2, 20)]
+    assert sorted(projects.requested) == list(range(2, 20))
+
+
+def test_fetch_pages_keeps_at_most_max_workers_pages_ahead():
+    """Test that pages are requested only max_workers ahead of the consumer."""
+    projects = _RecordingProjects()
+    pages = _adapter(projects)._fetch_pages(range(2, 100), page_size=10, max_workers=4)
+
+    consumed = [next(pages) for _ in range(3)]
+    pages.close()
+
+    assert consumed == [[2], [3], [4]]
+    # Three consumed pages plus at most four in flight; queued ones may be cancelled on close
+    assert 3 <= len(projects.requested) <= 3 + 4
+
+
+def test_iter_repository_pages_yields_every_project_in_order(stub_gitlab_adapter):
+    """Test that all pages are listed when GitLab reports the page count."""
+    adapter = stub_gitlab_adapter(project_count=25)
+
+    pages = list(adapter.iter_repository_pages(page_size=10))
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [repo.external_id for page in pages for repo in page] == [str(i) for i in range(1, 26)]
+    assert sorted(adapter.gl.projects.requested_pages) == [1, 2, 3]
+
+
+def test_iter_repository_pages_pages_sequentially_without_page_count(stub_gitlab_adapter):
+    """Test that pages are still listed when GitLab omits the page count."""
+    adapter = stub_gitlab_adapter(project_count=25, report_total_pages=False)
+
+    pages = list(adapter.iter_repository_pages(page_size=10))
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert pages[-1][-1].visibility == "private"
@@ -0,0 +1,108 @@
+"""
+Unit tests for markdown corpus builder.
+"""
+from pathlib import Path
+
+from adapters.git_platform.markdown_builder import MarkdownCorpusBuilder
+
+
+def _write(path, content=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def test_collect_files_skips_excluded_dirs(tmp_path):
+    """Test that excluded directories are pruned and only whitelisted files are collected."""
+    _write(tmp_path / "README.md", "readme")
+    _write(tmp_path / "src" / "app.py", "print()")
+    _write(tmp_path / "src" / "tool.exe", "binary")
+    _write(tmp_path / "node_modules" / "lib" / "index.js", "module")
+    _write(tmp_path / ".git" / "hooks" / "hook.sh", "hook")
+
+    builder = MarkdownCorpusBuilder()
+    files = builder._collect_files(tmp_path, builder.EXCLUDE_DIRS)
+
+    assert sorted((f.relative_to(tmp_path).as_posix(), size) for f, size in files) == [
+        ("README.md", 6),
+        ("src/app.py", 7),
+    ]
+
+
+def test_collect_files_ignores_excluded_names_above_repo(tmp_path):
+    """Test that an excluded name in the path leading to the repository does not hide its files."""
+    repo_path = tmp_path / "build" / "repo"
+    _write(repo_path / "main.go", "package main")
+
+    builder = MarkdownCorpusBuilder()
+    files = builder._collect_files(repo_path, builder.EXCLUDE_DIRS)
+
+    assert [f.name for f, _ in files] == ["main.go"]
+
+
+def test_write_markdown_skips_files_over_budget(tmp_path):
+    """Test that a file exceeding the remaining budget is skipped and smaller files still fit."""
+    repo_path = tmp_path / "repo"
+    big = repo_path / "big.py"
+    small = repo_path / "small.py"
+    _write(big, "x" * 500)
+    _write(small, "y" * 10)
+
+    builder = MarkdownCorpusBuilder()
+    file_count, total_size, is_complete = builder._write_markdown(
+        [big, small], repo_path, tmp_path / "corpus.md", 400, {big: 500, small: 10}
+    )
+
+    content = (tmp_path / "corpus.md").read_text(encoding="utf-8")
+    assert file_count == 1
+    assert not is_complete
+    assert "### small.py" in content
+    assert "### big.py" not in content
+    assert total_size <= 400
+
+
+def test_generate_tree_nests_files_under_their_directories(tmp_path):
+    """Test that files are listed below their own directory, directories first."""
+    files = [tmp_path / "README.md", tmp_path / "b" / "x.py", tmp_path / "a" / "c" / "y.py", tmp_path / "a" / "z.py"]
+
+    tree = MarkdownCorpusBuilder()._generate_tree(files, tmp_path)
+
+    assert tree.splitlines()[2:-1] == [
+        "  a/",
+        "    c/",
+        "      y.py",
+        "    z.py",
+        "  b/",
+        "    x.py",
+        "  README.md",
+    ]
+
+
+def test_write_markdown_skips_binary_files(tmp_path):
+    """Test that whitelisted files with binary content are left out of the corpus."""
+    repo_path = tmp_path / "repo"
+    binary = repo_path / "data.xml"
+    text = repo_path / "config.xml"
+    binary.parent.mkdir(parents=True)
+    binary.write_bytes(b"PK\x03\x04\x00\x00binary")
+    _write(text, "<config/>")
+
+    builder = MarkdownCorpusBuilder()
+    file_count, _, is_complete = builder._write_markdown([binary, text], repo_path, tmp_path / "corpus.md", 10_000)
+
+    content = (tmp_path / "corpus.md").read_text(encoding="utf-8")
+    assert file_count == 1
+    assert is_complete
+    assert "<config/>" in content
+    assert "### data.xml" not in content
+
+
+def test_build_corpus_keeps_relative_paths_for_relative_repo_root(tmp_path, monkeypatch):
+    """Test that a repository root given as "." yields complete relative paths."""
+    _write(tmp_path / "src" / "app.py", "print('hi')\n")
+    monkeypatch.chdir(tmp_path)
+
+    output_path = MarkdownCorpusBuilder().build_corpus(Path("."), [], [], 10_000, tmp_path / "out")
+
+    content = output_path.read_text(encoding="utf-8")
+    assert "### src/app.py" in content
+    assert "  src/\n    app.py" in content
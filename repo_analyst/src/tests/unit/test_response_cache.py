@@ -0,0 +1,60 @@
+"""
+Unit tests for KI response caches.
+"""
+from unittest import mock
+
+from adapters.ki.response_cache import MemoryResponseCache, SemanticResponseCache, response_cache_key
+
+
+def test_response_cache_key_depends_on_all_inputs():
+    """Test that the key changes with model, prompt, context and temperature."""
+    base = response_cache_key("model", "prompt", "context", 0)
+
+    assert base == response_cache_key("model", "prompt", "context", 0)
+    assert base != response_cache_key("other", "prompt", "context", 0)
+    assert base != response_cache_key("model", "other", "context", 0)
+    assert base != response_cache_key("model", "prompt", "other", 0)
+    assert base != response_cache_key("model", "prompt", "context", 0.7)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """Test that the oldest unused entry is evicted when the cache is full."""
+    cache = MemoryResponseCache(max_entries=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")
+    cache.set("c", {"v": 3})
+
+    assert cache.get("a") == {"v": 1}
+    assert cache.get("b") is None
+    assert cache.get("c") == {"v": 3}
+
+
+def test_memory_cache_expires_entries():
+    """Test that entries are dropped after their timeout."""
+    cache = MemoryResponseCache()
+    with mock.patch("adapters.ki.response_cache.time.monotonic", return_value=100.0):
+        cache.set("a", {"v": 1}, timeout=10)
+    with mock.patch("adapters.ki.response_cache.time.monotonic", return_value=109.0):
+        assert cache.get("a") == {"v": 1}
+    with mock.patch("adapters.ki.response_cache.time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+
+
+def test_memory_cache_returns_copies():
+    """Test that modifying a returned response does not change the cached one."""
+    cache = MemoryResponseCache()
+    cache.set("a", {"items": [1]})
+    cache.get("a")["items"].append(2)
+
+    assert cache.get("a") == {"items": [1]}
+
+
+def test_semantic_cache_matches_similar_prompt_on_same_context():
+    """Test that a reworded prompt hits, but only for the same context."""
+    cache = SemanticResponseCache(threshold=0.8)
+    cache.set("Analyze the test coverage of this repository", "Repository: a", {"v": 1})
+
+    assert cache.get("Please analyze the test coverage of this repository", "Repository: a") == {"v": 1}
+    assert cache.get("Please analyze the test coverage of this repository", "Repository: b") is None
+    assert cache.get("List all REST endpoints", "Repository: a") is None